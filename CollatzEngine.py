@@ -20,12 +20,13 @@ import os
 import sys
 import time
 import json
+import atexit
 import psutil
 import signal
 import numpy as np
 import subprocess
 from datetime import datetime
-from multiprocessing import Pool, Process, Queue as MPQueue, cpu_count
+from multiprocessing import Pool, Process, Queue as MPQueue, Event, Value, cpu_count
 from queue import Empty
 
 # Import error handler
@@ -50,6 +51,14 @@ else:
         GPU_AVAILABLE = False
         cp = None
 
+# Optional GMP-backed big integers for the CPU checker
+try:
+    import gmpy2
+    GMPY2_AVAILABLE = True
+except ImportError:
+    GMPY2_AVAILABLE = False
+    gmpy2 = None
+
 # Import contribution tracker
 try:
     from contribution_tracker import add_contribution
@@ -63,8 +72,14 @@ CONFIG_FILE = "collatz_config.json"
 COUNTEREXAMPLE_FILE = "counterexamples.txt"
 SAVE_INTERVAL = 10000000000  # Save every 10B (frequent saves for auto-tuner accuracy)
 NUM_STREAMS = 4
+CPU_TASK_BATCH = 64  # Numbers packed into each CPU task-queue message
+BATCH_RESIZE_INTERVAL = 100  # Re-check VRAM headroom every N kernel launches
+MAX_BATCH_GROWTH = 8  # Dynamic batch size never exceeds 8x the tuned size
+MEMPOOL_FREE_INTERVAL = 1000  # Release cached CuPy blocks every N kernel launches
+CPU_VECTOR_BLOCK = 65536  # Numbers stepped together per NumPy lane block on the CPU path
 
 shutdown_flag = False
+_counterexample_fh = None
 
 def detect_gpus():
     """Detect all available GPUs and return their properties."""
@@ -115,6 +130,41 @@ def set_low_priority():
     except:
         pass
 
+def _close_counterexample_file():
+    """Flush and fsync the counterexample log on interpreter exit."""
+    global _counterexample_fh
+    if _counterexample_fh is None:
+        return
+    try:
+        _counterexample_fh.flush()
+        os.fsync(_counterexample_fh.fileno())
+        _counterexample_fh.close()
+    except (OSError, ValueError):
+        pass
+    _counterexample_fh = None
+
+def record_counterexample(message):
+    """Append a timestamped line to COUNTEREXAMPLE_FILE.
+    The file is opened once (line-buffered) and fsynced at exit instead of
+    reopening it for every event."""
+    global _counterexample_fh
+    if _counterexample_fh is None:
+        _counterexample_fh = open(COUNTEREXAMPLE_FILE, 'a', buffering=1)
+        atexit.register(_close_counterexample_file)
+    _counterexample_fh.write(f"{datetime.now()}: {message}\n")
+
+def format_clock(now):
+    """Format an epoch timestamp as HH:MM:SS for the live display.
+    The string is only rebuilt when the whole second changes."""
+    sec = int(now)
+    if sec != format_clock._sec:
+        format_clock._sec = sec
+        format_clock._text = time.strftime('%H:%M:%S', time.localtime(sec))
+    return format_clock._text
+
+format_clock._sec = None
+format_clock._text = ''
+
 def format_time(seconds):
     """Format seconds into years, months, days, hours, minutes, seconds."""
     if seconds < 1:
@@ -252,6 +302,54 @@ if GPU_AVAILABLE:
     # Use memory pool to avoid frequent malloc/free operations
     mempool.set_limit(size=None)  # No limit, use all available
 
+def occupancy_threads_multiplier(fallback=8):
+    """Threads-per-block multiplier (in warps) suggested by the CUDA occupancy
+    API for the real Collatz kernel. Falls back to the old fixed value if the
+    kernel cannot be compiled or the driver query is unavailable."""
+    if hasattr(occupancy_threads_multiplier, '_cached'):
+        return occupancy_threads_multiplier._cached
+    
+    try:
+        _, block_size = cp.cuda.driver.occupancyMaxPotentialBlockSize(
+            collatz_kernel.kernel.ptr, 0, 0)
+        warp_size = cp.cuda.runtime.getDeviceProperties(cp.cuda.Device().id)['warpSize']
+        multiplier = max(1, block_size // warp_size)
+    except Exception:
+        multiplier = fallback
+    
+    occupancy_threads_multiplier._cached = multiplier
+    return multiplier
+
+def validate_launch_config(threads_per_block, batch_size, props, vram_total):
+    """Clamp a tuned launch config to what the device can physically run.
+    Returns (threads_per_block, batch_size, problems) where problems lists
+    every limit that had to be enforced."""
+    problems = []
+    warp_size = props['warpSize']
+    max_threads_per_block = props['maxThreadsPerBlock']
+    
+    if threads_per_block > max_threads_per_block:
+        problems.append(f"threads per block {threads_per_block} exceeds device limit {max_threads_per_block}")
+        threads_per_block = max_threads_per_block // warp_size * warp_size
+    
+    max_batch_size = int(vram_total * 0.9) // 4  # One int32 result per number
+    if batch_size > max_batch_size:
+        problems.append(f"batch size {batch_size:,} needs more than 90% of VRAM")
+        batch_size = max_batch_size // threads_per_block * threads_per_block
+    
+    return threads_per_block, batch_size, problems
+
+def default_gpu_tuning():
+    """Tuning used when gpu_tuning.json is missing or unreadable."""
+    return {
+        'work_multiplier': 800,
+        'threads_per_block_multiplier': occupancy_threads_multiplier(),
+        'blocks_per_sm': 4,
+        'memory_usage_percent': 5,
+        'batch_size_override': None,
+        'cpu_workers': None  # None = auto-detect, or specific number
+    }
+
 def get_gpu_config():
     """Get optimal GPU configuration based on hardware specs."""
     if not GPU_AVAILABLE:
@@ -266,14 +364,7 @@ def get_gpu_config():
                     logger.log_error('gpu_config', f'GPU tuning config invalid: {msg}')
                     print(f"[WARNING] {msg}")
                     print("[WARNING] Using default GPU tuning")
-                    tuning = {
-                        'work_multiplier': 800,
-                        'threads_per_block_multiplier': 8,
-                        'blocks_per_sm': 4,
-                        'memory_usage_percent': 5,
-                        'batch_size_override': None,
-                        'cpu_workers': None
-                    }
+                    tuning = default_gpu_tuning()
                 else:
                     # Handle new multi-GPU format or old format
                     if isinstance(tuning_data, dict) and 'config' in tuning_data:
@@ -295,27 +386,13 @@ def get_gpu_config():
                     else:
                         tuning = tuning_data  # Old format
         except FileNotFoundError:
-            tuning = {
-                'work_multiplier': 800,
-                'threads_per_block_multiplier': 8,
-                'blocks_per_sm': 4,
-                'memory_usage_percent': 5,
-                'batch_size_override': None,
-                'cpu_workers': None  # None = auto-detect, or specific number
-            }
+            tuning = default_gpu_tuning()
         except Exception as e:
             if ERROR_HANDLING:
                 logger.log_error('gpu_config', 'Error loading GPU tuning config', None, e)
             print(f"[WARNING] Error loading GPU tuning: {e}")
             print("[WARNING] Using defaults")
-            tuning = {
-                'work_multiplier': 800,
-                'threads_per_block_multiplier': 8,
-                'blocks_per_sm': 4,
-                'memory_usage_percent': 5,
-                'batch_size_override': None,
-                'cpu_workers': None
-            }
+            tuning = default_gpu_tuning()
         
         device = cp.cuda.Device()
         props = cp.cuda.runtime.getDeviceProperties(device.id)
@@ -340,7 +417,7 @@ def get_gpu_config():
         work_multiplier = tuning['work_multiplier']
         base_batch_size = (max_concurrent_threads * work_multiplier) // threads_per_block * threads_per_block
         
-        # No VRAM limit - let autotuner handle batch size entirely
+        # Autotuner controls batch size; only the physical VRAM limit is enforced below
         # Memory usage percent is ignored, batch_size_override has full control
         batch_size = base_batch_size
         
@@ -353,6 +430,14 @@ def get_gpu_config():
         elif batch_size >= 1_000_000:
             batch_size = (batch_size // 1_000_000) * 1_000_000
         
+        # Reject configs the hardware cannot launch before they reach the kernel
+        threads_per_block, batch_size, problems = validate_launch_config(
+            threads_per_block, batch_size, props, mem_info[1])
+        for problem in problems:
+            if problem not in get_gpu_config._warned:
+                get_gpu_config._warned.add(problem)
+                print(f"[WARNING] Invalid GPU tuning: {problem} - clamped")
+        
         return {
             'batch_size': batch_size,
             'threads_per_block': threads_per_block,
@@ -377,6 +462,8 @@ def get_gpu_config():
         print(f"[ERROR] GPU initialization failed: {e}")
         return None
 
+get_gpu_config._warned = set()  # Tuning problems already reported (config reloads every 5s)
+
 # GPU kernel for Collatz checking - Optimized branchless version
 if GPU_AVAILABLE:
     collatz_kernel = cp.RawKernel(r'''
@@ -484,21 +571,14 @@ if GPU_AVAILABLE:
     # Create CUDA streams for async execution
     cuda_streams = [cp.cuda.Stream(non_blocking=True) for _ in range(NUM_STREAMS)]
 
-def check_batch_gpu(start, batch_size, highest_proven, threads_per_block=256, timeout_seconds=60, stream=None):
-    """Check a batch on GPU with timeout and optional stream for async execution.
-    Optimized to minimize CPU-GPU transfers."""
+def launch_batch_gpu(start, batch_size, highest_proven, results, threads_per_block=256, stream=None):
+    """Queue the kernel for one batch of odd numbers on stream and return
+    without waiting; read_batch_gpu collects the outcome later."""
     start_high = start >> 64
     start_low = start & ((1 << 64) - 1)
     proven_high = highest_proven >> 64
     proven_low = highest_proven & ((1 << 64) - 1)
     
-    # Allocate results array on GPU (reuse if possible)
-    if not hasattr(check_batch_gpu, '_results_cache') or check_batch_gpu._results_cache.size != batch_size:
-        check_batch_gpu._results_cache = cp.zeros(batch_size, dtype=cp.int32)
-    
-    results = check_batch_gpu._results_cache
-    results.fill(0)  # Reset results on GPU (no transfer)
-    
     blocks = (batch_size + threads_per_block - 1) // threads_per_block
     
     # Use provided stream or default null stream
@@ -513,7 +593,14 @@ def check_batch_gpu(start, batch_size, highest_proven, threads_per_block=256, ti
                    cp.int32(steps_per_check))
     
     with exec_stream:
+        results.fill(0)  # Reset results on GPU (no transfer)
         collatz_kernel((blocks,), (threads_per_block,), kernel_args)
+
+def read_batch_gpu(start, batch_size, results, stream=None):
+    """Wait for a batch queued by launch_batch_gpu and classify its results."""
+    exec_stream = stream if stream is not None else cp.cuda.Stream.null
+    
+    with exec_stream:
         exec_stream.synchronize()
         
         # Minimize GPU-CPU data transfer by checking on GPU first
@@ -539,6 +626,49 @@ def check_batch_gpu(start, batch_size, highest_proven, threads_per_block=256, ti
     
     return ('success', batch_size)
 
+def check_batch_gpu(start, batch_size, highest_proven, threads_per_block=256, timeout_seconds=60, stream=None):
+    """Check a batch on GPU with timeout and optional stream for async execution.
+    Optimized to minimize CPU-GPU transfers."""
+    # Allocate results array on GPU (reuse if possible)
+    if not hasattr(check_batch_gpu, '_results_cache') or check_batch_gpu._results_cache.size != batch_size:
+        check_batch_gpu._results_cache = cp.zeros(batch_size, dtype=cp.int32)
+    
+    results = check_batch_gpu._results_cache
+    launch_batch_gpu(start, batch_size, highest_proven, results, threads_per_block, stream)
+    return read_batch_gpu(start, batch_size, results, stream)
+
+def pack_numbers(numbers):
+    """Encode non-negative ints as raw little-endian bytes for the CPU task queue.
+    The first byte stores the per-number width so values above 64 bits still fit."""
+    width = max((n.bit_length() + 7) // 8 for n in numbers) or 1
+    return bytes((width,)) + b''.join(n.to_bytes(width, 'little') for n in numbers)
+
+def unpack_numbers(payload):
+    """Decode a message produced by pack_numbers()."""
+    width = payload[0]
+    from_bytes = int.from_bytes
+    return [from_bytes(payload[i:i + width], 'little') for i in range(1, len(payload), width)]
+
+def queue_numbers(task_queue, first, step, count):
+    """Queue first, first+step, ... (count numbers) for the CPU workers.
+    Numbers are sent CPU_TASK_BATCH at a time so one message carries many
+    values instead of pickling every int separately."""
+    for offset in range(0, count, CPU_TASK_BATCH):
+        end = min(offset + CPU_TASK_BATCH, count)
+        task_queue.put(pack_numbers(range(first + offset * step, first + end * step, step)))
+
+def resize_batch_for_vram(batch_size, min_batch_size, max_batch_size):
+    """Grow or shrink batch_size to fit the current VRAM headroom.
+    Doubles while two more result buffers would fit, halves when not even one does."""
+    free_bytes = cp.cuda.Device().mem_info[0] + cp.get_default_memory_pool().free_bytes()
+    per_batch_bytes = batch_size * 4  # One int32 result per number
+    
+    if free_bytes > 2 * per_batch_bytes and batch_size * 2 <= max_batch_size:
+        return batch_size * 2
+    if free_bytes < per_batch_bytes and batch_size // 2 >= min_batch_size:
+        return batch_size // 2
+    return batch_size
+
 def cpu_collatz_worker(task_queue, result_queue, start_range):
     """CPU worker for difficult numbers. Optimized to minimize IPC overhead."""
     batch_results = []
@@ -546,49 +676,50 @@ def cpu_collatz_worker(task_queue, result_queue, start_range):
     
     while True:
         try:
-            num = task_queue.get(timeout=1)
+            payload = task_queue.get(timeout=1)
             
-            if num is None:
+            if payload is None:
                 # Flush remaining results before exiting
                 if batch_results:
                     for result in batch_results:
                         result_queue.put(result)
                 break
             
-            original_num = num
-            steps = 0
-            seen = set()
+            for num in unpack_numbers(payload):
+                original_num = num
+                steps = 0
+                seen = set()
             
-            while True:
-                if num == 1 or num < start_range:
-                    batch_results.append(('proven', original_num, steps))
-                    break
+                while True:
+                    if num == 1 or num < start_range:
+                        batch_results.append(('proven', original_num, steps))
+                        break
                 
-                if num in seen:
-                    # Counterexample is critical - send immediately
-                    result_queue.put(('disproven', original_num, steps))
-                    batch_results = []  # Clear batch
-                    break
+                    if num in seen:
+                        # Counterexample is critical - send immediately
+                        result_queue.put(('disproven', original_num, steps))
+                        batch_results = []  # Clear batch
+                        break
                 
-                if steps % 1000 == 0:
-                    seen.add(num)
+                    if steps % 1000 == 0:
+                        seen.add(num)
                 
-                if num % 2 == 1:
-                    num = (3 * num + 1) // 2
-                else:
-                    num = num // 2
+                    if num % 2 == 1:
+                        num = (3 * num + 1) // 2
+                    else:
+                        num = num // 2
                 
-                steps += 1
+                    steps += 1
                 
-                if steps > 100_000_000:
-                    batch_results.append(('inconclusive', original_num, steps))
-                    break
+                    if steps > 100_000_000:
+                        batch_results.append(('inconclusive', original_num, steps))
+                        break
             
-            # Send batch when it reaches batch_size (only for proven/inconclusive)
-            if len(batch_results) >= batch_size:
-                for result in batch_results:
-                    result_queue.put(result)
-                batch_results = []
+                # Send batch when it reaches batch_size (only for proven/inconclusive)
+                if len(batch_results) >= batch_size:
+                    for result in batch_results:
+                        result_queue.put(result)
+                    batch_results = []
                     
         except Empty:
             # Flush batch on idle
@@ -670,7 +801,7 @@ def run_gpu_mode():
     position = highest_proven + 1
     
     # Track session start for runtime calculation
-    session_start_time = time.time()
+    session_start_time = time.monotonic()
     
     # Skip to next odd number if starting on even
     if position % 2 == 0:
@@ -763,7 +894,7 @@ def run_gpu_mode():
     print("=" * 70)
     print("\nPress Ctrl+C to stop safely\n")
     
-    start_time = time.time()
+    start_time = time.monotonic()
     session_tested = 0
     last_save = 0
     last_display = 0
@@ -804,11 +935,10 @@ def run_gpu_mode():
                 print(f"This number enters a loop without reaching 1!")
                 print(f"{'='*70}\n")
                 
-                with open(COUNTEREXAMPLE_FILE, 'a') as f:
-                    f.write(f"{datetime.now()}: GPU DISPROVEN - Loop detected: {counterexample:,}\n")
+                record_counterexample(f"GPU DISPROVEN - Loop detected: {counterexample:,}")
                 
                 highest_proven = counterexample - 1
-                total_runtime = previous_total_runtime + (time.time() - session_start_time)
+                total_runtime = previous_total_runtime + (time.monotonic() - session_start_time)
                 save_config(highest_proven, total_tested, total_runtime, max_steps_ever)
                 return
             
@@ -819,9 +949,8 @@ def run_gpu_mode():
                 print(f"\n[CPU OFFLOAD] {count_inconclusive:,} difficult numbers detected")
                 print(f"              Sending to CPU workers...")
                 
-                for i in range(count_inconclusive):
-                    cpu_task_queue.put(first_inconclusive + (i << 1))  # Bit shift instead of multiply
-                    cpu_pending += 1
+                queue_numbers(cpu_task_queue, first_inconclusive, 2, count_inconclusive)
+                cpu_pending += count_inconclusive
                 
                 # CRITICAL: highest_proven is the last number BEFORE first inconclusive
                 highest_proven = first_inconclusive - 2
@@ -858,8 +987,7 @@ def run_gpu_mode():
                             print(f"Steps: {info:,}")
                             print(f"{'='*70}\n")
                             
-                            with open(COUNTEREXAMPLE_FILE, 'a') as f:
-                                f.write(f"{datetime.now()}: CPU DISPROVEN: {num:,} after {info:,} steps\n")
+                            record_counterexample(f"CPU DISPROVEN: {num:,} after {info:,} steps")
                 except Empty:
                     pass
             
@@ -870,7 +998,7 @@ def run_gpu_mode():
                     if shutdown_flag:
                         break
                 
-                current_time = time.time()
+                current_time = time.monotonic()
                 
                 # Periodically reload GPU config to allow live tuning
                 if current_time - last_config_check >= config_check_interval:
@@ -908,7 +1036,7 @@ def run_gpu_mode():
                     output = [
                         "\033[2J\033[H",  # Clear screen and move cursor to top
                         "=" * 70,
-                        f"SESSION SUMMARY - {datetime.now().strftime('%H:%M:%S')}",
+                        f"SESSION SUMMARY - {format_clock(time.time())}",
                         "=" * 70,
                         f"Highest proven:  {highest_proven:,}",
                         f"Session tested:  {session_tested:,}",
@@ -935,7 +1063,7 @@ def run_gpu_mode():
                                 "session_elapsed": session_elapsed,
                                 "current_rate": current_rate,
                                 "average_rate": rate,
-                                "timestamp": current_time
+                                "timestamp": time.time()
                             }
                             json.dump(stats, f)
                     except:
@@ -955,10 +1083,10 @@ def run_gpu_mode():
             cpu_task_queue.put(None)
         
         if session_tested > 0:
-            session_elapsed = time.time() - session_start_time
+            session_elapsed = time.monotonic() - session_start_time
             total_runtime = previous_total_runtime + session_elapsed
             save_config(highest_proven, total_tested, total_runtime, max_steps_ever, record_contribution=True, session_tested=session_tested)
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             rate = session_tested / elapsed if elapsed > 0 else 0
             
             # Calculate final current rate over last display_interval
@@ -995,16 +1123,22 @@ def run_gpu_mode():
 # CPU MODE
 # ============================================================================
 
-def collatz_check_cpu(n, highest_proven):
-    """Check if n reaches 1 using CPU."""
+def collatz_check_cpu(n, highest_proven, _max_steps=100000, _set=set):
+    """Check if n reaches 1 using CPU.
+    _max_steps and _set are bound at definition time so the hot loop reads
+    them as fast locals; callers should not pass them."""
     if n <= highest_proven:
         return (True, 0, 'already_proven')
     
+    # Beyond one machine word, GMP's mpz does 3n+1 and shifts without a new
+    # PyLong per operation; small values stay on native ints (faster there)
+    if GMPY2_AVAILABLE and n.bit_length() > 63:
+        n = gmpy2.mpz(n)
+    
     steps = 0
-    visited = set()
-    max_steps = 100000
+    visited = _set()
     
-    while n > 1 and steps < max_steps:
+    while n > 1 and steps < _max_steps:
         if n in visited:
             return (False, steps, 'loop_detected')
         
@@ -1021,21 +1155,108 @@ def collatz_check_cpu(n, highest_proven):
             steps += 1
         else:
             # Even: divide by 2^k where k = trailing zeros
-            tz = (n & -n).bit_length() - 1
+            # Above one machine word, let GMP scan for the lowest set bit
+            # instead of materializing the n & -n mask
+            if GMPY2_AVAILABLE and n > 0xFFFFFFFFFFFFFFFF:
+                tz = gmpy2.bit_scan1(n)
+            else:
+                tz = (n & -n).bit_length() - 1
             n >>= tz
             steps += tz
     
-    if steps >= max_steps:
+    if steps >= _max_steps:
         return (False, steps, 'step_limit')
     
     return (n == 1, steps, 'reached_1' if n == 1 else 'unknown')
 
+# Largest odd value whose 3n+1 still fits in a uint64 lane
+_U64_STEP_LIMIT = (0xFFFFFFFFFFFFFFFF - 1) // 3
+
+def collatz_block_vectorized(first, count, highest_proven, _max_steps=100000):
+    """Step count consecutive numbers from first together in uint64 NumPy lanes
+    until each drops to highest_proven (or 1). Returns the sorted offsets of
+    numbers the lanes could not settle - 3n+1 would overflow or the step limit
+    was hit - so the caller can re-check just those with collatz_check_cpu."""
+    one = np.uint64(1)
+    floor = np.uint64(max(highest_proven, 1))
+    limit = np.uint64(_U64_STEP_LIMIT)
+    
+    values = np.arange(count, dtype=np.uint64) + np.uint64(first)
+    offsets = np.arange(count)
+    live = values > floor
+    values, offsets = values[live], offsets[live]
+    
+    unsettled = []
+    rounds = 0
+    # Each round is one or two Collatz steps, so stopping at half the limit
+    # never settles a number the scalar checker would reject
+    while values.size and rounds < _max_steps // 2:
+        odd = values & one
+        overflow = (odd == one) & (values > limit)
+        if overflow.any():
+            unsettled.append(offsets[overflow])
+            keep = ~overflow
+            values, offsets, odd = values[keep], offsets[keep], odd[keep]
+        # Branch-free shortcut step: odd -> (3n+1)/2 = (n>>1) + n + 1, even -> n>>1
+        values = (values >> one) + odd * (values + one)
+        rounds += 1
+        live = values > floor
+        if not live.all():
+            values, offsets = values[live], offsets[live]
+    
+    if values.size:
+        unsettled.append(offsets)
+    if not unsettled:
+        return offsets[:0]
+    return np.sort(np.concatenate(unsettled))
+
+_worker_stop_event = None
+
 def worker_check_range(args):
     """Worker function to check a range of numbers."""
     start, count, highest_proven = args
-    set_low_priority()
+    stop_event = _worker_stop_event
+    
+    # Within uint64 range, step whole blocks in NumPy lanes and only fall back
+    # to the scalar checker for the few numbers the lanes could not settle
+    if highest_proven < _U64_STEP_LIMIT and start + count <= _U64_STEP_LIMIT:
+        for block_start in range(0, count, CPU_VECTOR_BLOCK):
+            if stop_event is not None and stop_event.is_set():
+                return {
+                    'counterexample': None,
+                    'numbers_checked': block_start,
+                    'aborted': True
+                }
+            
+            block_count = min(CPU_VECTOR_BLOCK, count - block_start)
+            for offset in collatz_block_vectorized(start + block_start, block_count, highest_proven):
+                i = block_start + int(offset)
+                n = start + i
+                reaches_1, steps, reason = collatz_check_cpu(n, highest_proven)
+                
+                if not reaches_1:
+                    if stop_event is not None:
+                        stop_event.set()
+                    return {
+                        'counterexample': n,
+                        'numbers_checked': i,
+                        'reason': reason
+                    }
+        
+        return {
+            'counterexample': None,
+            'numbers_checked': count
+        }
     
     for i in range(count):
+        # Abandon the rest of the chunk once a peer has found a counterexample
+        if stop_event is not None and not (i & 4095) and stop_event.is_set():
+            return {
+                'counterexample': None,
+                'numbers_checked': i,
+                'aborted': True
+            }
+        
         n = start + i
         
         if n <= highest_proven:
@@ -1044,6 +1265,8 @@ def worker_check_range(args):
         reaches_1, steps, reason = collatz_check_cpu(n, highest_proven)
         
         if not reaches_1:
+            if stop_event is not None:
+                stop_event.set()
             return {
                 'counterexample': n,
                 'numbers_checked': i,
@@ -1055,19 +1278,38 @@ def worker_check_range(args):
         'numbers_checked': count
     }
 
-def init_worker():
-    """Initialize worker to ignore SIGINT."""
+def init_worker(worker_counter=None, stop_event=None):
+    """Initialize pool worker: ignore SIGINT and drop to low priority once.
+    If a shared counter is given, each worker also pins itself to its own core.
+    stop_event is shared so workers can stop early after a counterexample."""
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+    
     try:
         signal.signal(signal.SIGINT, signal.SIG_IGN)
     except (AttributeError, ValueError) as e:
         # On some platforms (e.g., Android), signal handling may not work
         pass
+    
+    set_low_priority()
+    
+    if worker_counter is not None:
+        # Pool passes identical initargs to every worker, so hand out indices here
+        with worker_counter.get_lock():
+            worker_idx = worker_counter.value
+            worker_counter.value += 1
+        try:
+            cores = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cores[worker_idx % len(cores)]})
+        except (AttributeError, OSError):
+            # CPU affinity is only available on Linux
+            pass
 
 def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previous_total_runtime):
     """CPU mode with GPU batch processing using VRAM."""
     global shutdown_flag
     
-    session_start_time = time.time()
+    session_start_time = time.monotonic()
     position = highest_proven + 1
     batch_size = gpu_config['batch_size']
     threads_per_block = gpu_config['threads_per_block']
@@ -1100,14 +1342,18 @@ def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previ
     print(f"Save interval: {SAVE_INTERVAL:,}")
     print("Press Ctrl+C to stop safely\n")
     
-    start_time = time.time()
+    start_time = time.monotonic()
     session_tested = 0
     last_save = 0
+    batch_counter = 0
+    min_batch_size = threads_per_block
+    max_batch_size = batch_size * MAX_BATCH_GROWTH
     
     try:
         while not shutdown_flag:
             # Use GPU kernel for batch checking (using VRAM)
             result = check_batch_gpu(position, batch_size, highest_proven, threads_per_block)
+            batch_counter += 1
             
             if result[0] == 'disproven':
                 counterexample = result[1]
@@ -1117,11 +1363,10 @@ def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previ
                 print(f"Number: {counterexample:,}")
                 print(f"{'='*70}\n")
                 
-                with open(COUNTEREXAMPLE_FILE, 'a') as f:
-                    f.write(f"{datetime.now()}: GPU DISPROVEN - Loop detected: {counterexample:,}\n")
+                record_counterexample(f"GPU DISPROVEN - Loop detected: {counterexample:,}")
                 
                 highest_proven = counterexample - 1
-                total_runtime = previous_total_runtime + (time.time() - session_start_time)
+                total_runtime = previous_total_runtime + (time.monotonic() - session_start_time)
                 save_config(highest_proven, total_tested, total_runtime, None)
                 break
             
@@ -1131,9 +1376,8 @@ def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previ
                 
                 print(f"[CPU OFFLOAD] {count_inconclusive:,} difficult numbers → CPU workers")
                 
-                for i in range(count_inconclusive):
-                    cpu_task_queue.put(first_inconclusive + i)
-                    cpu_pending += 1
+                queue_numbers(cpu_task_queue, first_inconclusive, 1, count_inconclusive)
+                cpu_pending += count_inconclusive
                 
                 position += batch_size
                 session_tested += batch_size
@@ -1157,23 +1401,36 @@ def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previ
                         print(f"Number: {num:,}")
                         print(f"{'='*70}\n")
                         
-                        with open(COUNTEREXAMPLE_FILE, 'a') as f:
-                            f.write(f"{datetime.now()}: CPU DISPROVEN: {num:,} after {info:,} steps\n")
+                        record_counterexample(f"CPU DISPROVEN: {num:,} after {info:,} steps")
             except Empty:
                 pass
             
+            # Track VRAM headroom so small GPUs avoid OOM and large ones use spare memory
+            if batch_counter % BATCH_RESIZE_INTERVAL == 0:
+                new_batch_size = resize_batch_for_vram(batch_size, min_batch_size, max_batch_size)
+                if new_batch_size != batch_size:
+                    print(f"[BATCH RESIZE] {batch_size:,} → {new_batch_size:,} (VRAM headroom)")
+                    batch_size = new_batch_size
+            
+            # Return transient blocks to the driver now and then; doing it every
+            # launch would defeat the pool's caching
+            if batch_counter % MEMPOOL_FREE_INTERVAL == 0:
+                mempool.free_all_blocks()
+            
+            current_time = time.monotonic()
+            
             if session_tested - last_save >= SAVE_INTERVAL:
-                total_runtime = previous_total_runtime + (time.time() - session_start_time)
+                total_runtime = previous_total_runtime + (current_time - session_start_time)
                 save_config(highest_proven, total_tested, total_runtime, None)
                 last_save = session_tested
             
-            elapsed = time.time() - start_time
+            elapsed = current_time - start_time
             rate = session_tested / elapsed if elapsed > 0 else 0
             
             cpu_status = f" | CPU: {cpu_pending}" if cpu_pending > 0 else ""
             vram_used = cp.get_default_memory_pool().used_bytes() / 1024**3
             
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] "
+            print(f"[{format_clock(time.time())}] "
                   f"Proven: {highest_proven:,} | "
                   f"Rate: {rate:,.0f}/s | "
                   f"VRAM: {vram_used:.2f}GB{cpu_status}")
@@ -1190,9 +1447,9 @@ def run_gpu_accelerated_cpu_mode(gpu_config, highest_proven, total_tested, previ
             cpu_task_queue.put(None)
         
         if session_tested > 0:
-            total_runtime = previous_total_runtime + (time.time() - session_start_time)
+            total_runtime = previous_total_runtime + (time.monotonic() - session_start_time)
             save_config(highest_proven, total_tested, total_runtime, None)
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             rate = session_tested / elapsed if elapsed > 0 else 0
             
             # Calculate current rate
@@ -1250,10 +1507,10 @@ def run_cpu_mode():
     
     set_low_priority()
     
-    session_start_time = time.time()
+    session_start_time = time.monotonic()
     position = highest_proven + 1
     session_tested = 0
-    start_time = time.time()
+    start_time = time.monotonic()
     workers = cpu_cores
     chunk_size = 10000
     save_interval_cpu = 100000
@@ -1265,7 +1522,8 @@ def run_cpu_mode():
     print("Press Ctrl+C to stop safely\n")
     
     try:
-        with Pool(workers, initializer=init_worker) as pool:
+        stop_event = Event()
+        with Pool(workers, initializer=init_worker, initargs=(Value('i', 0), stop_event)) as pool:
             while not shutdown_flag:
                 work = [
                     (position + i * chunk_size, chunk_size, highest_proven)
@@ -1275,9 +1533,9 @@ def run_cpu_mode():
                 results = pool.map(worker_check_range, work)
                 
                 for result in results:
-                    if result[0] == 'counterexample':
-                        counterexample = result[1]
-                        reason = result[2] if len(result) > 2 else 'unknown'
+                    if result['counterexample'] is not None:
+                        counterexample = result['counterexample']
+                        reason = result.get('reason', 'unknown')
                         
                         print(f"\n{'='*70}")
                         print("!!! COUNTEREXAMPLE FOUND !!!")
@@ -1286,11 +1544,10 @@ def run_cpu_mode():
                         print(f"Reason: {reason}")
                         print(f"{'='*70}\n")
                         
-                        with open(COUNTEREXAMPLE_FILE, 'a') as f:
-                            f.write(f"{datetime.now()}: CPU {counterexample:,} ({reason})\n")
+                        record_counterexample(f"CPU {counterexample:,} ({reason})")
                         
                         highest_proven = counterexample - 1
-                        total_runtime = previous_total_runtime + (time.time() - session_start_time)
+                        total_runtime = previous_total_runtime + (time.monotonic() - session_start_time)
                         save_config(highest_proven, total_tested, total_runtime, None)
                         return
                 
@@ -1300,15 +1557,17 @@ def run_cpu_mode():
                 session_tested += batch_size
                 total_tested += batch_size
                 
+                current_time = time.monotonic()
+                
                 if session_tested % save_interval_cpu < batch_size:
-                    total_runtime = previous_total_runtime + (time.time() - session_start_time)
+                    total_runtime = previous_total_runtime + (current_time - session_start_time)
                     save_config(highest_proven, total_tested, total_runtime, None)
                 
-                elapsed = time.time() - start_time
+                elapsed = current_time - start_time
                 rate = session_tested / elapsed if elapsed > 0 else 0
                 ram_pct = psutil.virtual_memory().percent
                 
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] "
+                print(f"[{format_clock(time.time())}] "
                       f"Proven: {highest_proven:,} | "
                       f"Rate: {rate:,.0f}/s | "
                       f"Session: {session_tested:,} | "
@@ -1318,10 +1577,10 @@ def run_cpu_mode():
         pass
     finally:
         if session_tested > 0:
-            total_runtime = previous_total_runtime + (time.time() - session_start_time)
+            total_runtime = previous_total_runtime + (time.monotonic() - session_start_time)
             save_config(highest_proven, total_tested, total_runtime, None)
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             rate = session_tested / elapsed if elapsed > 0 else 0
             
             # Calculate current rate
@@ -1408,11 +1667,16 @@ def main():
 
 # API functions for distributed_collatz.py
 def gpu_check_range(start: int, end: int) -> dict:
-    """Check a range of numbers using GPU (API for distributed workers)."""
+    """Check a range of numbers using GPU (API for distributed workers).
+    Batches alternate between two streams: while the host reads one batch's
+    result the next is already running, so the GPU is not left idle.
+    
+    Like cpu_check_range, numbers_checked counts every integer in
+    [start, end) that was covered, even numbers included, although the kernel
+    only steps the odd numbers."""
     if not GPU_AVAILABLE:
         return cpu_check_range(start, end)
     
-    numbers_checked = 0
     batch_size = 1000000
     config = get_gpu_config()
     
@@ -1420,43 +1684,65 @@ def gpu_check_range(start: int, end: int) -> dict:
         # GPU initialization failed, fall back to CPU
         return cpu_check_range(start, end)
     
-    highest_proven = end
+    # Everything below the assigned range is already proven
+    highest_proven = start - 1
+    
+    # The kernel checks odd numbers only: first, first + 2, ...
+    first = start | 1
+    total_odd = max(0, (end - first + 1) // 2)
+    
+    streams = (cp.cuda.Stream(non_blocking=True), cp.cuda.Stream(non_blocking=True))
+    buffers = (cp.zeros(batch_size, dtype=cp.int32), cp.zeros(batch_size, dtype=cp.int32))
     
     try:
-        current = start
-        while current < end:
-            chunk_size = min(batch_size, end - current)
-            result = check_batch_gpu(current, chunk_size, highest_proven, 
-                                    config['threads_per_block'])
+        pending = None  # (batch_start, count, slot) launched but not yet read
+        slot = 0
+        offset = 0
+        while offset < total_odd or pending is not None:
+            if offset < total_odd:
+                count = min(batch_size, total_odd - offset)
+                batch_start = first + 2 * offset
+                launch_batch_gpu(batch_start, count, highest_proven, buffers[slot][:count],
+                                 config['threads_per_block'], streams[slot])
+                launched = (batch_start, count, slot)
+                offset += count
+                slot ^= 1
+            else:
+                launched = None
             
-            # check_batch_gpu returns tuple: ('status', value, ...)
-            if result[0] == 'disproven':
-                return {
-                    "counterexample": result[1],
-                    "numbers_checked": numbers_checked + (result[1] - start)
-                }
-            elif result[0] == 'success':
-                numbers_checked += result[1]
-            elif result[0] == 'inconclusive':
-                # For API simplicity, treat inconclusive as success (needs CPU follow-up)
-                numbers_checked += chunk_size
+            if pending is not None:
+                batch_start, count, done_slot = pending
+                result = read_batch_gpu(batch_start, count, buffers[done_slot][:count], streams[done_slot])
+                
+                # read_batch_gpu returns tuple: ('status', value, ...)
+                if result[0] == 'disproven':
+                    return {
+                        "counterexample": result[1],
+                        "numbers_checked": result[1] - start
+                    }
+                # For API simplicity, 'inconclusive' counts as success (needs CPU follow-up)
             
-            current += chunk_size
+            pending = launched
         
-        return {"counterexample": None, "numbers_checked": numbers_checked}
+        return {"counterexample": None, "numbers_checked": max(0, end - start)}
     except Exception as e:
         print(f"[GPU ERROR] {e}, falling back to CPU")
         import traceback
         traceback.print_exc()
         return cpu_check_range(start, end)
+    finally:
+        # Don't release the buffers while a batch may still be running
+        for stream in streams:
+            stream.synchronize()
 
 
 def cpu_check_range(start: int, end: int) -> dict:
-    """Check a range of numbers using CPU (API for distributed workers)."""
+    """Check a range of numbers using CPU (API for distributed workers).
+    numbers_checked counts every integer in [start, end) that was covered."""
     import multiprocessing as mp
     
     numbers_checked = 0
-    chunk_size = 10000
+    chunk_size = CPU_VECTOR_BLOCK * 4
     num_workers = min(mp.cpu_count(), 8)
     pool = mp.Pool(num_workers, initializer=init_worker)
     
@@ -1465,7 +1751,8 @@ def cpu_check_range(start: int, end: int) -> dict:
         current = start
         while current < end:
             chunk_end = min(current + chunk_size, end)
-            ranges.append((current, chunk_end, end))
+            # (start, count, highest_proven): everything below the range is proven
+            ranges.append((current, chunk_end - current, start - 1))
             current = chunk_end
         
         results = pool.map(worker_check_range, ranges)
@@ -10,10 +10,16 @@ https://creativecommons.org/licenses/by-nc-sa/4.0/
 
 import subprocess
 import time
+import functools
 import json
 import platform
+import re
+import statistics
 import sys
+import threading
+from collections import deque
 from datetime import datetime
+from queue import SimpleQueue, Empty
 import os
 import optimization_state
 
@@ -25,11 +31,54 @@ except ImportError:
     ERROR_HANDLING = False
     logger = None
 
+# CuPy is imported on first use so CPU-only runs skip the CUDA driver load
+_cp = None
+_GPU_AVAILABLE = None
+
+def _get_cupy():
+    """Import cupy once on demand; returns the module or None."""
+    global _cp, _GPU_AVAILABLE
+    if _GPU_AVAILABLE is None:
+        try:
+            import cupy
+            _cp = cupy
+            _GPU_AVAILABLE = True
+        except ImportError:
+            _GPU_AVAILABLE = False
+    return _cp
+
+# Optional C-level JSON encoder for the results file
 try:
-    import cupy as cp
-    GPU_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GPU_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_gpus():
+    """Query every CUDA device once; the benchmark header and the system
+    specs both reuse this instead of going back to the driver."""
+    cp = _get_cupy()
+    gpus = []
+    for i in range(cp.cuda.runtime.getDeviceCount()):
+        with cp.cuda.Device(i):
+            props = cp.cuda.runtime.getDeviceProperties(i)
+            mem_info = cp.cuda.Device(i).mem_info
+            
+            gpus.append({
+                "id": i,
+                "name": props['name'].decode() if isinstance(props['name'], bytes) else props['name'],
+                "vram_total_gb": round(mem_info[1] / (1024**3), 2),
+                "vram_free_gb": round(mem_info[0] / (1024**3), 2),
+                "compute_capability": f"{props['major']}.{props['minor']}",
+                "multiprocessor_count": props['multiProcessorCount'],
+                "clock_rate_mhz": props['clockRate'] / 1000,
+                "memory_clock_rate_mhz": props['memoryClockRate'] / 1000,
+                "memory_bus_width": props['memoryBusWidth'],
+                "max_threads_per_block": props['maxThreadsPerBlock'],
+                "max_threads_per_multiprocessor": props['maxThreadsPerMultiProcessor'],
+            })
+    return tuple(gpus)
 
 def get_system_specs():
     """Collect system specifications."""
@@ -42,31 +91,11 @@ def get_system_specs():
     }
     
     # GPU info - detect all GPUs
-    if GPU_AVAILABLE:
+    if _get_cupy() is not None:
         try:
-            gpu_count = cp.cuda.runtime.getDeviceCount()
+            specs["gpus"] = list(_enumerate_gpus())
+            gpu_count = len(specs["gpus"])
             specs["gpu_count"] = gpu_count
-            specs["gpus"] = []
-            
-            for i in range(gpu_count):
-                with cp.cuda.Device(i):
-                    props = cp.cuda.runtime.getDeviceProperties(i)
-                    mem_info = cp.cuda.Device(i).mem_info
-                    
-                    gpu_info = {
-                        "id": i,
-                        "name": props['name'].decode() if isinstance(props['name'], bytes) else props['name'],
-                        "vram_total_gb": round(mem_info[1] / (1024**3), 2),
-                        "vram_free_gb": round(mem_info[0] / (1024**3), 2),
-                        "compute_capability": f"{props['major']}.{props['minor']}",
-                        "multiprocessor_count": props['multiProcessorCount'],
-                        "clock_rate_mhz": props['clockRate'] / 1000,
-                        "memory_clock_rate_mhz": props['memoryClockRate'] / 1000,
-                        "memory_bus_width": props['memoryBusWidth'],
-                        "max_threads_per_block": props['maxThreadsPerBlock'],
-                        "max_threads_per_multiprocessor": props['maxThreadsPerMultiProcessor'],
-                    }
-                    specs["gpus"].append(gpu_info)
             
             # Keep backward compatibility with single GPU field (primary GPU)
             if gpu_count > 0:
@@ -82,88 +111,132 @@ def get_system_specs():
     
     return specs
 
+# Deletion table for thousands separators in printed numbers
+_NO_COMMA = str.maketrans('', '', ',')
+
+def _to_float(text):
+    """Convert a comma-grouped number captured by the parsers to float."""
+    return float(text.translate(_NO_COMMA))
+
+# One alternation per checker field; group names double as the result keys
+_CHECKER_RE = re.compile(
+    r'Current rate:\s*(?P<current_rate_odd_per_sec>\d[\d,]*(?:\.\d+)?)\s*odd/s'
+    r'|Highest proven:\s*(?P<highest_proven>\S+)'
+    r'|Session tested:\s*(?P<session_tested>\S+)'
+    r'|Total tested:\s*(?P<total_tested>\S+)'
+    r'|Average rate:\s*(?P<average_rate_odd_per_sec>\d[\d,]*(?:\.\d+)?)\s*odd/s'
+)
+_CHECKER_FLOAT_FIELDS = frozenset(('current_rate_odd_per_sec', 'average_rate_odd_per_sec'))
+
 def parse_checker_output(line):
     """Parse hybrid checker output for metrics."""
     data = {}
-    if "Current rate:" in line:
-        try:
-            parts = line.split("Current rate:")[1].split("odd/s")[0].strip()
-            data["current_rate_odd_per_sec"] = float(parts.replace(",", ""))
-        except:
-            pass
-    
-    if "Highest proven:" in line:
-        try:
-            parts = line.split("Highest proven:")[1].split()[0].strip()
-            data["highest_proven"] = parts
-        except:
-            pass
-    
-    if "Session tested:" in line:
-        try:
-            parts = line.split("Session tested:")[1].split()[0].strip()
-            data["session_tested"] = parts
-        except:
-            pass
-    
-    if "Total tested:" in line:
-        try:
-            parts = line.split("Total tested:")[1].split()[0].strip()
-            data["total_tested"] = parts
-        except:
-            pass
-    
-    if "Average rate:" in line:
-        try:
-            parts = line.split("Average rate:")[1].split("odd/s")[0].strip()
-            data["average_rate_odd_per_sec"] = float(parts.replace(",", ""))
-        except:
-            pass
-    
+    for match in _CHECKER_RE.finditer(line):
+        key = match.lastgroup
+        value = match.group(key)
+        if key in _CHECKER_FLOAT_FIELDS:
+            value = _to_float(value)
+        data[key] = value
     return data
 
+# Group names double as the config keys
+_TUNER_CFG_RE = re.compile(
+    r'Batch:\s*(?P<batch_size>\d[\d,]*)\s*\|\s*Threads:\s*(?P<threads>\d+)'
+    r'(?:\s*\|\s*Work:\s*(?P<work_multiplier>\d+))?'
+    r'(?:\s*\|\s*Blocks/SM:\s*(?P<blocks_per_sm>\d+))?'
+)
+_TUNER_PEAK_RE = re.compile(r'\[NEW (?:PEAK|BEST)\].*?(\d[\d,]*(?:\.\d+)?)\s*odd/s')
+_TUNER_STAGE1_RE = re.compile(r'STAGE 1 COMPLETE(?:.*?Best rate:\s*(\d[\d,]*(?:\.\d+)?)\s*odd/s)?')
+
 def parse_tuner_output(line):
     """Parse auto-tuner output for configs and rates."""
     data = {}
     
-    if "[NEW PEAK]" in line or "[NEW BEST]" in line:
-        try:
-            parts = line.split("odd/s")[0]
-            rate = parts.split()[-1]
-            data["new_peak_rate"] = float(rate.replace(",", ""))
-        except:
-            pass
+    match = _TUNER_PEAK_RE.search(line)
+    if match:
+        data["new_peak_rate"] = _to_float(match.group(1))
     
-    if "Batch:" in line and "Threads:" in line:
-        try:
-            config = {}
-            if "Batch:" in line:
-                batch = line.split("Batch:")[1].split("|")[0].strip()
-                config["batch_size"] = int(batch.replace(",", ""))
-            if "Threads:" in line:
-                threads = line.split("Threads:")[1].split("|")[0].strip()
-                config["threads"] = int(threads)
-            if "Work:" in line:
-                work = line.split("Work:")[1].split("|")[0].strip()
-                config["work_multiplier"] = int(work)
-            if "Blocks/SM:" in line:
-                blocks = line.split("Blocks/SM:")[1].strip()
-                config["blocks_per_sm"] = int(blocks)
-            if config:
-                data["config"] = config
-        except:
-            pass
+    match = _TUNER_CFG_RE.search(line)
+    if match:
+        data["config"] = {key: int(value.translate(_NO_COMMA))
+                          for key, value in match.groupdict().items() if value is not None}
     
-    if "STAGE 1 COMPLETE" in line:
+    match = _TUNER_STAGE1_RE.search(line)
+    if match:
         data["stage_1_complete"] = True
-        try:
-            parts = line.split("Best rate:")[1].split("odd/s")[0].strip()
-            data["stage_1_best_rate"] = float(parts.replace(",", ""))
-        except:
-            pass
+        if match.group(1):
+            data["stage_1_best_rate"] = _to_float(match.group(1))
     
     return data
 
+# The auto-tuner starts once the checker rate settles, or after the max wait
+BASELINE_MAX_WAIT = 60
+BASELINE_STABLE_SAMPLES = 5
+BASELINE_STABLE_RSD = 0.03  # Relative standard deviation
+
+# Rate lines and lines carrying these markers are always parsed. Other
+# checker lines are thinned per line type (the text before the first ':'),
+# so a fixed-size status block cannot alias with the sampling period.
+CHECKER_SAMPLE_WARMUP = 64
+CHECKER_SAMPLE_EVERY = 16
+_ALWAYS_PARSE_RE = re.compile(r'odd/s|PEAK|STAGE|COMPLETE')
+_MAX_LINE_TYPES = 256
+
+PIPE_CHUNK_SIZE = 1 << 16
+
+def _iter_lines(stream):
+    """Yield decoded lines from a binary pipe, reading large chunks with
+    os.read() rather than one buffered readline() per line."""
+    fd = stream.fileno()
+    pending = b''
+    while True:
+        chunk = os.read(fd, PIPE_CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        for raw in lines:
+            yield raw.decode('utf-8', 'replace').strip()
+    if pending:
+        yield pending.decode('utf-8', 'replace').strip()
+
+def _pump_output(source, stream, parser, out_queue, raw_fp, sample_every=1):
+    """Reader thread: block on a subprocess stream and queue parsed lines.
+    Works the same on every OS, unlike select() on pipes. Raw lines go
+    straight to a log file rather than accumulating in memory."""
+    type_counts = {}
+    for line in _iter_lines(stream):
+        raw_fp.write(line)
+        raw_fp.write('\n')
+        if sample_every > 1 and not _ALWAYS_PARSE_RE.search(line):
+            line_type = line.partition(':')[0]
+            seen = type_counts.get(line_type, 0) + 1
+            if len(type_counts) >= _MAX_LINE_TYPES and line_type not in type_counts:
+                type_counts.clear()
+            type_counts[line_type] = seen
+            if seen > CHECKER_SAMPLE_WARMUP and seen % sample_every:
+                continue
+        parsed = parser(line)
+        if parsed:
+            out_queue.put((source, parsed))
+
+def record_tuner_update(results, parsed, elapsed):
+    """Fold one parsed auto-tuner line into results, printing peaks and stage changes."""
+    if "config" in parsed:
+        results["last_tuner_config"] = parsed["config"]
+    if "new_peak_rate" in parsed:
+        results["tuner_peaks"].append({
+            "rate": parsed["new_peak_rate"],
+            "timestamp": elapsed
+        })
+        print(f"[PEAK] New peak: {parsed['new_peak_rate']:,.0f} odd/s")
+    if parsed.get("stage_1_complete"):
+        # The tuner does not always report a best rate with this line
+        if "stage_1_best_rate" in parsed:
+            print(f"[STAGE 1] Complete! Best: {parsed['stage_1_best_rate']:,.0f} odd/s")
+        else:
+            print("[STAGE 1] Complete!")
+
 def run_benchmark(duration_minutes=10):
     """Run the benchmark for specified duration."""
     print("=" * 70)
@@ -187,20 +260,16 @@ def run_benchmark(duration_minutes=10):
     
     # Determine mode and detect all GPUs
     mode = 'cpu'
-    if GPU_AVAILABLE:
+    if _get_cupy() is not None:
         try:
-            gpu_count = cp.cuda.runtime.getDeviceCount()
+            gpus = _enumerate_gpus()
             mode = 'gpu'
-            if gpu_count > 1:
-                print(f"Mode: GPU Hybrid (detected {gpu_count} GPUs - Multi-GPU)")
-                for i in range(gpu_count):
-                    with cp.cuda.Device(i):
-                        props = cp.cuda.runtime.getDeviceProperties(i)
-                        print(f"  [{i}] {props['name'].decode()}")
+            if len(gpus) > 1:
+                print(f"Mode: GPU Hybrid (detected {len(gpus)} GPUs - Multi-GPU)")
+                for gpu in gpus:
+                    print(f"  [{gpu['id']}] {gpu['name']}")
             else:
-                device = cp.cuda.Device()
-                props = cp.cuda.runtime.getDeviceProperties(device.id)
-                print(f"Mode: GPU Hybrid (detected {props['name'].decode()})")
+                print(f"Mode: GPU Hybrid (detected {gpus[0]['name']})")
         except:
             print("Mode: CPU-only (GPU detected but initialization failed)")
     else:
@@ -225,6 +294,37 @@ def run_benchmark(duration_minutes=10):
     print("=" * 70)
     print()
     
+    # Raw process output is streamed to disk; the JSON only records the paths
+    os.makedirs('benchmarks', exist_ok=True)
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    checker_raw_fp = open(f"benchmarks/raw_checker_{run_timestamp}.log", 'w', buffering=1 << 16)
+    tuner_raw_fp = open(f"benchmarks/raw_tuner_{run_timestamp}.log", 'w', buffering=1 << 16) if mode == 'gpu' else None
+    pump_threads = []
+    
+    # Collect data
+    results = {
+        "mode": mode,
+        "system_specs": specs,
+        "benchmark_duration_minutes": duration_minutes,
+        "checker_metrics": {},
+        "peak_rate_odd_per_sec": 0,  # Track peak rate
+        "last_tuner_config": None,  # Only the latest config feeds the summary
+        "tuner_peaks": [] if mode == 'gpu' else None,
+        "raw_output": {
+            "checker_log": checker_raw_fp.name,
+            "tuner_log": tuner_raw_fp.name if tuner_raw_fp else None
+        }
+    }
+    
+    # Reader threads feed parsed lines from both processes into one queue
+    output_queue = SimpleQueue()
+    
+    # Latest checker values live in a fixed-shape dict (keys never added
+    # in the loop) and the peak in a plain local; both are copied into
+    # results once the run ends.
+    _latest = dict.fromkeys(_CHECKER_RE.groupindex)
+    _peak = 0.0
+    
     # Start CollatzEngine with appropriate mode
     engine_cmd = [sys.executable, "CollatzEngine.py"]
     if mode == 'cpu':
@@ -235,36 +335,69 @@ def run_benchmark(duration_minutes=10):
     checker_process = subprocess.Popen(
         engine_cmd,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
+        stderr=subprocess.DEVNULL,
+        bufsize=PIPE_CHUNK_SIZE
     )
     
+    pump_threads.append(threading.Thread(
+        target=_pump_output,
+        args=('checker', checker_process.stdout, parse_checker_output,
+              output_queue, checker_raw_fp, CHECKER_SAMPLE_EVERY),
+        daemon=True
+    ))
+    pump_threads[-1].start()
+    
     print(f"[ENGINE] Started CollatzEngine in {mode.upper()} mode")
     
-    # Wait 60 seconds before starting auto-tuner (GPU mode only)
+    # Wait for a stable baseline before starting auto-tuner (GPU mode only)
     tuner_process = None
     if mode == 'gpu':
-        print("[WAITING] Waiting 60 seconds for baseline performance...")
-        time.sleep(60)
+        print(f"[WAITING] Waiting up to {BASELINE_MAX_WAIT} seconds for baseline performance...")
+        # Leave early once the last few rate samples agree closely
+        baseline_rates = deque(maxlen=BASELINE_STABLE_SAMPLES)
+        baseline_deadline = time.monotonic() + BASELINE_MAX_WAIT
+        while (now := time.monotonic()) < baseline_deadline:
+            try:
+                source, parsed = output_queue.get(timeout=min(1.0, baseline_deadline - now))
+            except Empty:
+                continue
+            _latest.update(parsed)
+            rate = parsed.get("current_rate_odd_per_sec")
+            if rate is None:
+                continue
+            if rate > _peak:
+                _peak = rate
+            baseline_rates.append(rate)
+            if len(baseline_rates) == BASELINE_STABLE_SAMPLES:
+                mean_rate = statistics.mean(baseline_rates)
+                if mean_rate > 0 and statistics.pstdev(baseline_rates) / mean_rate < BASELINE_STABLE_RSD:
+                    print(f"[BASELINE] Rate stable at {mean_rate:,.0f} odd/s")
+                    break
         
         # Start auto-tuner
         tuner_process = subprocess.Popen(
             [sys.executable, "auto_tuner.py"],
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            stderr=subprocess.DEVNULL,
+            bufsize=PIPE_CHUNK_SIZE,
             stdin=subprocess.PIPE
         )
         
         # Auto-respond to resume prompt if it appears
         try:
-            tuner_process.stdin.write('n\n')
+            tuner_process.stdin.write(b'n\n')
             tuner_process.stdin.flush()
         except:
             pass
         
+        pump_threads.append(threading.Thread(
+            target=_pump_output,
+            args=('tuner', tuner_process.stdout, parse_tuner_output,
+                  output_queue, tuner_raw_fp),
+            daemon=True
+        ))
+        pump_threads[-1].start()
+        
         print("[TUNER] Started auto-tuner")
     else:
         print("[CPU MODE] Skipping auto-tuner (GPU-only feature)")
@@ -275,29 +408,15 @@ def run_benchmark(duration_minutes=10):
     print("=" * 70)
     print()
     
-    # Collect data
-    results = {
-        "mode": mode,
-        "system_specs": specs,
-        "benchmark_duration_minutes": duration_minutes,
-        "checker_metrics": {},
-        "peak_rate_odd_per_sec": 0,  # Track peak rate
-        "tuner_configs": [] if mode == 'gpu' else None,
-        "tuner_peaks": [] if mode == 'gpu' else None,
-        "raw_output": {
-            "checker": [],
-            "tuner": [] if mode == 'gpu' else None
-        }
-    }
-    
-    start_time = time.time()
+    # Monotonic clock: immune to NTP/wall-clock jumps during the run
+    start_time = time.monotonic()
     end_time = start_time + (duration_minutes * 60)
     
-    last_update = time.time()
+    last_update = start_time
     update_interval = 30  # Update every 30 seconds
     
     try:
-        while time.time() < end_time:
+        while (now := time.monotonic()) < end_time:
             # Check if processes are still running
             if checker_process.poll() is not None:
                 print("\n[ERROR] Hybrid checker process died unexpectedly!")
@@ -306,88 +425,32 @@ def run_benchmark(duration_minutes=10):
             if tuner_process is not None and tuner_process.poll() is not None:
                 print("\n[WARNING] Auto-tuner process ended")
             
-            # Read from checker (non-blocking)
+            # Wait for the next parsed line from either process
             try:
-                import select
-                if sys.platform != 'win32':
-                    # Unix-like systems
-                    ready, _, _ = select.select([checker_process.stdout], [], [], 0.1)
-                    if ready:
-                        line = checker_process.stdout.readline()
-                        if line:
-                            line = line.strip()
-                            results["raw_output"]["checker"].append(line)
-                            parsed = parse_checker_output(line)
-                            if parsed:
-                                results["checker_metrics"].update(parsed)
-                else:
-                    # Windows - just try to read
-                    line = checker_process.stdout.readline()
-                    if line:
-                        line = line.strip()
-                        results["raw_output"]["checker"].append(line)
-                        parsed = parse_checker_output(line)
-                        if parsed:
-                            results["checker_metrics"].update(parsed)
-                            # Track peak rate
-                            if "current_rate_odd_per_sec" in parsed:
-                                if parsed["current_rate_odd_per_sec"] > results["peak_rate_odd_per_sec"]:
-                                    results["peak_rate_odd_per_sec"] = parsed["current_rate_odd_per_sec"]
-            except:
-                pass
+                source, parsed = output_queue.get(timeout=min(1.0, end_time - now))
+            except Empty:
+                source, parsed = None, None
             
-            # Read from tuner (non-blocking) - GPU mode only
-            if tuner_process:
-                try:
-                    if sys.platform != 'win32':
-                        ready, _, _ = select.select([tuner_process.stdout], [], [], 0.1)
-                        if ready:
-                            line = tuner_process.stdout.readline()
-                            if line:
-                                line = line.strip()
-                                results["raw_output"]["tuner"].append(line)
-                                parsed = parse_tuner_output(line)
-                                if "config" in parsed:
-                                    results["tuner_configs"].append(parsed["config"])
-                                if "new_peak_rate" in parsed:
-                                    results["tuner_peaks"].append({
-                                        "rate": parsed["new_peak_rate"],
-                                        "timestamp": time.time() - start_time
-                                    })
-                                    print(f"[PEAK] New peak: {parsed['new_peak_rate']:,.0f} odd/s")
-                                if parsed.get("stage_1_complete"):
-                                    print(f"[STAGE 1] Complete! Best: {parsed.get('stage_1_best_rate', 'N/A'):,.0f} odd/s")
-                    else:
-                        line = tuner_process.stdout.readline()
-                        if line:
-                            line = line.strip()
-                            results["raw_output"]["tuner"].append(line)
-                            parsed = parse_tuner_output(line)
-                            if "config" in parsed:
-                                results["tuner_configs"].append(parsed["config"])
-                            if "new_peak_rate" in parsed:
-                                results["tuner_peaks"].append({
-                                    "rate": parsed["new_peak_rate"],
-                                    "timestamp": time.time() - start_time
-                                })
-                                print(f"[PEAK] New peak: {parsed['new_peak_rate']:,.0f} odd/s")
-                            if parsed.get("stage_1_complete"):
-                                print(f"[STAGE 1] Complete! Best: {parsed.get('stage_1_best_rate', 'N/A'):,.0f} odd/s")
-                except:
-                    pass
+            if source == 'checker':
+                _latest.update(parsed)
+                # Track peak rate
+                rate = parsed.get("current_rate_odd_per_sec")
+                if rate is not None and rate > _peak:
+                    _peak = rate
+            elif source == 'tuner':
+                record_tuner_update(results, parsed, time.monotonic() - start_time)
             
             # Periodic status update
-            if time.time() - last_update > update_interval:
-                elapsed = time.time() - start_time
-                remaining = end_time - time.time()
-                if "current_rate_odd_per_sec" in results["checker_metrics"]:
-                    rate = results["checker_metrics"]["current_rate_odd_per_sec"]
+            now = time.monotonic()
+            if now - last_update > update_interval:
+                elapsed = now - start_time
+                remaining = end_time - now
+                rate = _latest["current_rate_odd_per_sec"]
+                if rate is not None:
                     print(f"[{elapsed/60:.1f}m] Current rate: {rate:,.0f} odd/s | {remaining/60:.1f}m remaining")
                 else:
                     print(f"[{elapsed/60:.1f}m] Benchmark running... | {remaining/60:.1f}m remaining")
-                last_update = time.time()
-            
-            time.sleep(0.5)
+                last_update = now
     
     except KeyboardInterrupt:
         print("\n\n[STOPPED] Benchmark interrupted by user")
@@ -397,32 +460,41 @@ def run_benchmark(duration_minutes=10):
         print("STOPPING PROCESSES...")
         print("=" * 70)
         
-        # Stop processes
-        if tuner_process:
+        # Stop processes: signal both, then share one 2 s grace period
+        processes = [p for p in (tuner_process, checker_process) if p]
+        for process in processes:
             try:
-                tuner_process.terminate()
-                time.sleep(2)
-                if tuner_process.poll() is None:
-                    tuner_process.kill()
+                process.terminate()
             except:
                 pass
         
-        try:
-            checker_process.terminate()
-            time.sleep(2)
-            if checker_process.poll() is None:
-                checker_process.kill()
-        except:
-            pass
+        shutdown_deadline = time.monotonic() + 2
+        for process in processes:
+            try:
+                process.wait(timeout=max(0, shutdown_deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                process.kill()
+            except:
+                pass
+        
+        # Let the reader threads drain to EOF before closing the raw logs
+        for thread in pump_threads:
+            thread.join(timeout=2)
+        checker_raw_fp.close()
+        if tuner_raw_fp:
+            tuner_raw_fp.close()
         
         print("[STOPPED] All processes terminated")
         print()
     
+    results["checker_metrics"] = {key: value for key, value in _latest.items() if value is not None}
+    results["peak_rate_odd_per_sec"] = _peak
+    
     # Calculate summary
     is_optimized = optimization_state.is_system_optimized()
     results["summary"] = {
         "benchmark_completed": True,
-        "actual_duration_seconds": time.time() - start_time,
+        "actual_duration_seconds": time.monotonic() - start_time,
         "system_optimized": is_optimized,
         "mode": mode
     }
@@ -444,8 +516,8 @@ def run_benchmark(duration_minutes=10):
         results["summary"]["peak_tuner_rate_odd_per_sec"] = max_peak["rate"]
         results["summary"]["peak_tuner_rate_effective_per_sec"] = max_peak["rate"] * 2
     
-    if results["tuner_configs"] and len(results["tuner_configs"]) > 0:
-        results["summary"]["optimal_config"] = results["tuner_configs"][-1]
+    if results["last_tuner_config"]:
+        results["summary"]["optimal_config"] = results["last_tuner_config"]
     
     return results
 
@@ -457,8 +529,12 @@ def save_results(results):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"benchmarks/benchmark_results_{timestamp}.json"
     
-    with open(filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(results, f, indent=2)
     
     print("=" * 70)
     print("BENCHMARK RESULTS")
@@ -488,6 +564,9 @@ def save_results(results):
     print()
     
     print(f"Results saved to: {filename}")
+    raw_logs = [path for path in results.get("raw_output", {}).values() if path]
+    if raw_logs:
+        print(f"Raw output logs: {', '.join(raw_logs)}")
     print()
     print("=" * 70)
     print("THANK YOU FOR BENCHMARKING!")
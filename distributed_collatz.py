@@ -17,19 +17,38 @@ Run this to join the distributed verification network!
 import os
 import sys
 import time
+import glob
 import json
+import struct
+import signal
 import argparse
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from typing import Optional, Dict
 from datetime import datetime
-from dataclasses import asdict
 
 # Import distributed components
 from ipfs_coordinator import IPFSCoordinator, IPFS_AVAILABLE
 from trust_system import TrustSystem
-from proof_verification import ProofVerificationSystem, CRYPTO_AVAILABLE
+from proof_verification import ProofVerificationSystem, CRYPTO_AVAILABLE, proof_json_bytes
 from user_account import UserAccountManager, UserAccount
 from counterexample_handler import CounterexampleCoordinator
 
+# Key (de)serialization; missing cryptography is reported via CRYPTO_AVAILABLE
+try:
+    from cryptography.hazmat.primitives import serialization
+except ImportError:
+    serialization = None
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt(n: int) -> str:
+    """Thousands-grouped integer; range bounds repeat across prints, so cache them."""
+    return f"{n:,}"
+
+
 # Import CollatzEngine components
 try:
     from CollatzEngine import gpu_check_range, cpu_check_range, GPU_AVAILABLE
@@ -42,10 +61,24 @@ except ImportError:
 class DistributedCollatzWorker:
     """A worker node in the FULLY DECENTRALIZED Collatz verification network."""
     
+    # Idle polling: back off exponentially while no work is assigned
+    IDLE_BACKOFF_MIN = 1  # seconds
+    IDLE_BACKOFF_MAX = 60  # seconds
+    
+    # One fixed-size record per verified range, appended to worker_stats_<id>.bin:
+    # ranges verified, numbers checked, compute time (s), unix timestamp
+    STATS_RECORD = struct.Struct('<QQdd')
+    STATS_FILE_MAX_BYTES = STATS_RECORD.size * 32768  # then rotate to <file>.1
+    
+    # Converted proof dicts kept for repeat counterexample checks (LRU)
+    PROOF_DICT_CACHE_SIZE = 1024
+    
     def __init__(self, ipfs_api: str = '/ip4/127.0.0.1/tcp/5001',
                  use_gpu: bool = True,
                  user_key_file: Optional[str] = None,
-                 worker_name: Optional[str] = None):
+                 worker_name: Optional[str] = None,
+                 stats_interval: int = 10,
+                 auto_vote: str = 'prompt'):
         """
         Initialize distributed worker.
         
@@ -54,6 +87,8 @@ class DistributedCollatzWorker:
             use_gpu: Use GPU if available
             user_key_file: Path to user private key (for account linking)
             worker_name: Optional worker name
+            stats_interval: Print session statistics every N verified ranges
+            auto_vote: Counterexample vote - 'continue', 'shutdown' or 'prompt'
         """
         if not IPFS_AVAILABLE:
             raise ImportError("Please install: pip install ipfshttpclient")
@@ -65,8 +100,9 @@ class DistributedCollatzWorker:
             raise ImportError("CollatzEngine.py not found")
         
         # Initialize components
-        self.coordinator = IPFSCoordinator(ipfs_api=ipfs_api)
+        # One TrustSystem per process, shared with the coordinator
         self.trust_system = TrustSystem()
+        self.coordinator = IPFSCoordinator(ipfs_api=ipfs_api, trust_system=self.trust_system)
         self.verifier = ProofVerificationSystem(self.trust_system)
         self.account_manager = UserAccountManager()
         self.counterexample_handler = CounterexampleCoordinator(self.coordinator)
@@ -99,9 +135,19 @@ class DistributedCollatzWorker:
         # Load or generate worker keypair
         self.private_key, self.public_key = self.load_or_generate_keypair()
         
-        # Register public key with network
-        public_key_pem = self.verifier.serialize_public_key(self.public_key)
-        self.verifier.register_worker_key(self.worker_id, public_key_pem)
+        # Register public key with network (PEM encoded once and kept)
+        self.public_key_pem = self.verifier.serialize_public_key(self.public_key)
+        self.verifier.register_worker_key(self.worker_id, self.public_key_pem)
+        
+        # Proof signer with this worker's fixed arguments bound once; each
+        # range only passes its own results
+        self._sign_proof = functools.partial(
+            self.verifier.create_signed_proof,
+            private_key=self.private_key,
+            worker_id=self.worker_id,
+            user_id=self.user_id,  # CRITICAL: Include user_id to prevent self-verification
+            max_steps=100000  # Adjust based on your max_steps
+        )
         
         # Register worker with trust system (link to user if available)
         self.trust_system.register_worker(self.worker_id, self.user_id)
@@ -111,6 +157,39 @@ class DistributedCollatzWorker:
         self.total_numbers_checked = 0
         self.total_compute_time = 0.0
         self.session_start = time.time()
+        self.stats_interval = max(1, stats_interval)
+        self.stats_file = f"worker_stats_{self.worker_id[:16]}.bin"
+        
+        # Idle wait state - set the event to wake the loop early
+        self._idle_backoff = self.IDLE_BACKOFF_MIN
+        self._wakeup = threading.Event()
+        
+        # Counterexample voting (prompt runs on its own thread)
+        self.auto_vote = auto_vote
+        self._shutdown_requested = False
+        self._vote_thread: Optional[threading.Thread] = None
+        
+        # Background bookkeeping that the next range does not depend on
+        # (single thread keeps account updates in order)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='worker-io')
+        self._pending_io = []
+        
+        # Fields of the detailed IPFS proof that are fixed for this worker;
+        # each range copies this and fills in its own results
+        self._proof_template = {
+            'worker_id': self.worker_id,
+            'worker_name': self.worker_name,
+            'user_id': self.user_id,  # Include user ID
+            'username': self.user_account.username if self.user_account else None,
+            'verification_mode': 'GPU' if self.use_gpu else 'CPU',
+            'engine_version': '1.0'
+        }
+        
+        # Last network statistics shown, so repeat reports only print changes
+        self._last_net_stats: Dict = {}
+        
+        # Proof dicts for the counterexample check, keyed by (proof_id, ipfs_cid)
+        self._proof_dicts: OrderedDict = OrderedDict()
         
         print(f"[WORKER] 🌐 Fully Decentralized Node: {self.worker_name}")
         print(f"[WORKER] Node ID: {self.worker_id[:16]}...")
@@ -129,9 +208,42 @@ class DistributedCollatzWorker:
         
         print(f"[WORKER] 🚀 Network runs forever with n>0 nodes!")
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def close(self):
+        """Finish background IO and queued trust writes, then release the
+        executor and IPFS session."""
+        self._wakeup.set()  # End any idle backoff wait
+        self._reap_background_io(wait=True)
+        self._io_pool.shutdown(wait=True)
+        self.trust_system.flush()
+        self.coordinator.close()
+    
     def load_or_generate_keypair(self):
-        """Load existing keypair or generate new one."""
+        """
+        Load existing keypair or generate new one.
+        Startup reads the raw DER key; the JSON/PEM file is the readable
+        backup and is only parsed once to migrate older nodes.
+        """
         keypair_file = f"worker_keypair_{self.worker_id[:16]}.json"
+        der_file = f"worker_keypair_{self.worker_id[:16]}.der"
+        
+        # Fast path: DER needs no base64 or PEM armour parsing
+        try:
+            with open(der_file, 'rb') as f:
+                private_key = serialization.load_der_private_key(f.read(), password=None)
+            print(f"[WORKER] Loaded existing keypair from {der_file}")
+            return private_key, private_key.public_key()
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            # Torn or corrupt copy; the JSON/PEM backup below rewrites it
+            print(f"[WORKER] ⚠️ Ignoring unreadable {der_file}: {e}")
         
         try:
             # Try to load existing keypair
@@ -139,7 +251,6 @@ class DistributedCollatzWorker:
                 data = json.load(f)
                 
             # Deserialize private key
-            from cryptography.hazmat.primitives import serialization
             private_key = serialization.load_pem_private_key(
                 data['private_key'].encode('utf-8'),
                 password=None
@@ -153,7 +264,6 @@ class DistributedCollatzWorker:
             private_key, public_key = self.verifier.generate_worker_keypair()
             
             # Save for future use
-            from cryptography.hazmat.primitives import serialization
             private_pem = private_key.private_bytes(
                 encoding=serialization.Encoding.PEM,
                 format=serialization.PrivateFormat.PKCS8,
@@ -174,6 +284,17 @@ class DistributedCollatzWorker:
             print(f"[WORKER] Generated new keypair, saved to {keypair_file}")
             print(f"[WORKER] ⚠️ BACKUP THIS FILE! It's your worker identity.")
         
+        # DER copy used by every later start; replaced atomically so an
+        # interrupted write never leaves a torn key behind
+        tmp_file = der_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(private_key.private_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PrivateFormat.PKCS8,
+                encryption_algorithm=serialization.NoEncryption()
+            ))
+        os.replace(tmp_file, der_file)
+        
         return private_key, public_key
     
     def claim_and_verify_work(self) -> bool:
@@ -182,6 +303,8 @@ class DistributedCollatzWorker:
         Tracks contributions for user account if logged in.
         Returns True if work was completed, False if no work available.
         """
+        self._reap_background_io()
+        
         # Claim work assignment (now passes user_id for tracking)
         assignment = self.coordinator.claim_work(self.worker_id, self.user_id)
         
@@ -192,8 +315,8 @@ class DistributedCollatzWorker:
         print(f"\n[WORKER] 🔨 Starting verification of range:")
         if self.user_id:
             print(f"[WORKER]   User: {self.user_account.username}")
-        print(f"[WORKER]   Range: {assignment.range_start:,} to {assignment.range_end:,}")
-        print(f"[WORKER]   Numbers: ~{assignment.range_end - assignment.range_start:,}")
+        print(f"[WORKER]   Range: {_fmt(assignment.range_start)} to {_fmt(assignment.range_end)}")
+        print(f"[WORKER]   Numbers: ~{_fmt(assignment.range_end - assignment.range_start)}")
         
         # Verify the range
         start_time = time.time()
@@ -215,35 +338,26 @@ class DistributedCollatzWorker:
             
             # Create detailed proof for IPFS
             detailed_proof = {
-                'worker_id': self.worker_id,
-                'worker_name': self.worker_name,
-                'user_id': self.user_id,  # Include user ID
-                'username': self.user_account.username if self.user_account else None,
+                **self._proof_template,
                 'assignment_id': assignment.assignment_id,
                 'range_start': assignment.range_start,
                 'range_end': assignment.range_end,
                 'all_converged': all_converged,
                 'numbers_checked': numbers_checked,
                 'compute_time': compute_time,
-                'timestamp': time.time(),
-                'verification_mode': 'GPU' if self.use_gpu else 'CPU',
-                'engine_version': '1.0'
+                'timestamp': time.time()
             }
             
             # Upload proof to IPFS via coordinator
-            proof_cid = self.coordinator.client.add_json(detailed_proof)
+            proof_cid = self.coordinator.client.add_bytes(proof_json_bytes(detailed_proof))
             print(f"[WORKER] Proof uploaded to IPFS: /ipfs/{proof_cid[:16]}...")
             
             # Create signed proof
-            signed_proof = self.verifier.create_signed_proof(
-                private_key=self.private_key,
-                worker_id=self.worker_id,
-                user_id=self.user_id,  # CRITICAL: Include user_id to prevent self-verification
+            signed_proof = self._sign_proof(
                 range_start=assignment.range_start,
                 range_end=assignment.range_end,
                 all_converged=all_converged,
                 numbers_checked=numbers_checked,
-                max_steps=100000,  # Adjust based on your max_steps
                 compute_time=compute_time,
                 ipfs_cid=proof_cid
             )
@@ -269,7 +383,7 @@ class DistributedCollatzWorker:
                 print(f"\n{'=' * 70}")
                 print(f"🚨 POTENTIAL COUNTEREXAMPLE DETECTED 🚨")
                 print(f"{'=' * 70}")
-                print(f"Range: {assignment.range_start:,} to {assignment.range_end:,}")
+                print(f"Range: {_fmt(assignment.range_start)} to {_fmt(assignment.range_end)}")
                 print(f"This could be THE number that breaks Collatz!")
                 print(f"Waiting for additional verifications...")
                 print(f"{'=' * 70}\n")
@@ -278,7 +392,7 @@ class DistributedCollatzWorker:
                 proofs = self.coordinator.get_proofs_for_assignment(assignment.assignment_id)
                 counterexample = self.counterexample_handler.check_for_counterexample(
                     assignment.assignment_id,
-                    [asdict(p) for p in proofs]
+                    [self._proof_dict(p) for p in proofs]
                 )
                 
                 if counterexample:
@@ -296,56 +410,30 @@ class DistributedCollatzWorker:
                         self.coordinator.genesis_timestamp
                     )
                     
-                    # Start voting
-                    self.counterexample_handler.start_voting(voting_duration_hours=24)
-                    
-                    # Get user vote
-                    while True:
-                        vote_input = input("\nYour vote [Y=Continue / N=Shutdown]: ").strip().upper()
-                        if vote_input in ['Y', 'N']:
-                            break
-                        print("Please enter Y or N")
-                    
-                    vote_continue = (vote_input == 'Y')
-                    self.counterexample_handler.submit_vote(
-                        self.worker_id,
-                        self.user_id,
-                        vote_continue
-                    )
-                    
-                    # Check if decision reached
+                    # Start voting (once - restarting would discard the votes so far)
                     if not self.counterexample_handler.voting_active:
-                        # Decision made, exit worker
-                        stats = self.counterexample_handler.get_voting_stats()
-                        if stats['votes_shutdown'] > stats['votes_continue']:
-                            print(f"\n[WORKER] Network voted to SHUTDOWN. Goodbye!")
-                            sys.exit(0)
-                        else:
-                            print(f"\n[WORKER] Network voted to CONTINUE. Resuming work...")
-                    else:
-                        print(f"\n[WORKER] Vote submitted. Waiting for others...")
+                        self.counterexample_handler.start_voting(voting_duration_hours=24)
+                        
+                        # Get this node's vote without stalling verification;
+                        # only one prompt may own stdin at a time
+                        if self.auto_vote != 'prompt':
+                            self._cast_counterexample_vote()
+                        elif self._vote_thread is None or not self._vote_thread.is_alive():
+                            self._vote_thread = threading.Thread(target=self._cast_counterexample_vote,
+                                                                 name='counterexample-vote', daemon=True)
+                            self._vote_thread.start()
             
             # Update statistics
             self.total_ranges_verified += 1
             self.total_numbers_checked += numbers_checked
             self.total_compute_time += compute_time
             
-            # Update user account contributions if logged in
+            # Update user account contributions if logged in (off the
+            # critical path - the account file write does not gate the next range)
             if self.user_id and self.account_manager and consensus_reached:
-                try:
-                    self.account_manager.update_contributions(
-                        self.user_id,
-                        numbers_checked,
-                        1,  # 1 range completed
-                        compute_time
-                    )
-                    # Show updated user stats
-                    stats = self.account_manager.get_user_stats(self.user_id)
-                    print(f"[WORKER] 👤 User Stats: {stats['total_numbers_checked']:,} numbers | "
-                          f"{stats['total_ranges_completed']:,} ranges | "
-                          f"{stats['total_compute_time']:.1f}s total")
-                except Exception as e:
-                    print(f"[WORKER] ⚠️ Failed to update user contributions: {e}")
+                self._pending_io.append(
+                    self._io_pool.submit(self._record_contribution, numbers_checked, compute_time)
+                )
             
             # Check if range is complete and submit progress claim with consensus
             if consensus_reached and all_converged:
@@ -364,15 +452,95 @@ class DistributedCollatzWorker:
             traceback.print_exc()
             return False
     
+    def _voting_open(self) -> bool:
+        """True while a counterexample vote is open and before its deadline."""
+        handler = self.counterexample_handler
+        return handler.voting_active and (handler.voting_deadline is None
+                                          or time.time() <= handler.voting_deadline)
+    
+    def _cast_counterexample_vote(self):
+        """Vote on continuing after a confirmed counterexample.
+        Interactive votes run on a background thread; a SHUTDOWN decision is
+        handed to run_worker_loop, which stops before claiming more work."""
+        if self.auto_vote == 'prompt':
+            while True:
+                vote_input = input("\nYour vote [Y=Continue / N=Shutdown]: ").strip().upper()
+                if vote_input in ['Y', 'N']:
+                    break
+                print("Please enter Y or N")
+            vote_continue = (vote_input == 'Y')
+        else:
+            vote_continue = (self.auto_vote == 'continue')
+            print(f"[WORKER] Auto-vote: {'CONTINUE' if vote_continue else 'SHUTDOWN'}")
+        
+        self.counterexample_handler.submit_vote(
+            self.worker_id,
+            self.user_id,
+            vote_continue
+        )
+        self._wakeup.set()  # Let run_worker_loop re-check the vote now
+        
+        # Check if decision reached
+        if not self.counterexample_handler.voting_active:
+            # Decision made
+            stats = self.counterexample_handler.get_voting_stats()
+            if stats['votes_shutdown'] > stats['votes_continue']:
+                print(f"\n[WORKER] Network voted to SHUTDOWN. Finishing up...")
+                self._shutdown_requested = True
+            else:
+                print(f"\n[WORKER] Network voted to CONTINUE. Resuming work...")
+        else:
+            print(f"\n[WORKER] Vote submitted. Waiting for others...")
+    
+    def _proof_dict(self, proof) -> Dict:
+        """Return proof as a dict, converting each distinct proof only once."""
+        key = (proof.proof_id, proof.ipfs_cid)
+        cached = self._proof_dicts.get(key)
+        if cached is None:
+            cached = self._proof_dicts[key] = proof.to_dict()
+            if len(self._proof_dicts) > self.PROOF_DICT_CACHE_SIZE:
+                self._proof_dicts.popitem(last=False)
+        else:
+            self._proof_dicts.move_to_end(key)
+        return cached
+    
+    def _record_contribution(self, numbers_checked: int, compute_time: float):
+        """Persist a completed range to the user account (runs on the IO pool)."""
+        try:
+            self.account_manager.update_contributions(
+                self.user_id,
+                numbers_checked,
+                1,  # 1 range completed
+                compute_time
+            )
+            # Show updated user stats
+            stats = self.account_manager.get_user_stats(self.user_id)
+            print(f"[WORKER] 👤 User Stats: {stats['total_numbers_checked']:,} numbers | "
+                  f"{stats['total_ranges_completed']:,} ranges | "
+                  f"{stats['total_compute_time']:.1f}s total")
+        except Exception as e:
+            print(f"[WORKER] ⚠️ Failed to update user contributions: {e}")
+    
+    def _reap_background_io(self, wait: bool = False):
+        """Drop finished background tasks, reporting any that raised."""
+        still_pending = []
+        for future in self._pending_io:
+            if not wait and not future.done():
+                still_pending.append(future)
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                print(f"[WORKER] ⚠️ Background task failed: {e}")
+        self._pending_io = still_pending
+    
     def verify_range_gpu(self, start: int, end: int) -> bool:
         """
         Verify range using GPU with actual CollatzEngine integration.
         Returns True if all numbers converge, False if counterexample found.
         """
         try:
-            # Import and use actual GPU verification from CollatzEngine
-            from CollatzEngine import gpu_check_range
-            
+            # CollatzEngine's batched GPU kernels (imported at module load)
             print(f"[WORKER] 🚀 Using GPU verification for range [{start}, {end})")
             result = gpu_check_range(start, end)
             
@@ -381,13 +549,9 @@ class DistributedCollatzWorker:
                 print(f"\n🎯 COUNTEREXAMPLE FOUND: {counterexample}\n")
                 return False
             
-            print(f"[WORKER] ✅ Verified {result['numbers_checked']:,} numbers converge to 1")
+            print(f"[WORKER] ✅ Verified {_fmt(result['numbers_checked'])} numbers converge to 1")
             return True
             
-        except ImportError as e:
-            print(f"[WORKER] ⚠️ CollatzEngine not available: {e}")
-            print(f"[WORKER] Falling back to basic verification...")
-            return self.verify_range_basic(start, end)
         except Exception as e:
             print(f"[WORKER] ❌ GPU verification error: {e}")
             import traceback
@@ -402,8 +566,7 @@ class DistributedCollatzWorker:
         print(f"[WORKER] Using CPU verification...")
         
         try:
-            from CollatzEngine import cpu_check_range
-            
+            # Fans the range out over a process pool, so the GIL is not a limit
             result = cpu_check_range(start, end)
             
             if result.get('counterexample') is not None:
@@ -413,9 +576,6 @@ class DistributedCollatzWorker:
             print(f"[WORKER] ✓ Verified {result.get('numbers_checked', end - start)} numbers")
             return True
             
-        except ImportError:
-            print(f"[WORKER] ⚠️ CollatzEngine.py not found, using basic verification")
-            return self.verify_range_basic(start, end)
         except Exception as e:
             print(f"[WORKER] ❌ CPU verification error: {e}")
             import traceback
@@ -434,9 +594,29 @@ class DistributedCollatzWorker:
         print(f"[WORKER] Press Ctrl+C to stop\n")
         
         iterations = 0
+        paused_for_vote = False
         
         try:
             while True:
+                # Stop once the network has voted to shut down
+                if self._shutdown_requested:
+                    print(f"[WORKER] Network voted to SHUTDOWN. Goodbye!")
+                    break
+                
+                # No new claims while the counterexample vote is open; work
+                # already handed to the background pool keeps finishing
+                if self._voting_open():
+                    if not paused_for_vote:
+                        print(f"[WORKER] ⏸️ Counterexample vote open - pausing new work claims")
+                        paused_for_vote = True
+                    self._reap_background_io()
+                    self._wakeup.wait(self.IDLE_BACKOFF_MAX)
+                    self._wakeup.clear()
+                    continue
+                if paused_for_vote:
+                    print(f"[WORKER] ▶️ Vote closed - resuming work claims")
+                    paused_for_vote = False
+                
                 # Check if we've reached iteration limit
                 if num_iterations is not None and iterations >= num_iterations:
                     print(f"[WORKER] Completed {num_iterations} iterations")
@@ -447,17 +627,57 @@ class DistributedCollatzWorker:
                 
                 if work_done:
                     iterations += 1
+                    self._idle_backoff = self.IDLE_BACKOFF_MIN
+                    self.append_stats_record()
+                    # Show session statistics
+                    if self.total_ranges_verified % self.stats_interval == 0:
+                        self.show_statistics()
                 else:
                     # No work available, wait before checking again
-                    print(f"[WORKER] Waiting 60s for new work...")
-                    time.sleep(60)
-                
-                # Show session statistics
-                self.show_statistics()
+                    print(f"[WORKER] Waiting up to {self._idle_backoff}s for new work...")
+                    self._wakeup.wait(self._idle_backoff)
+                    self._wakeup.clear()
+                    self._idle_backoff = min(self._idle_backoff * 2, self.IDLE_BACKOFF_MAX)
                 
         except KeyboardInterrupt:
             print(f"\n[WORKER] Shutting down gracefully...")
+            self._reap_background_io(wait=True)
             self.show_final_statistics()
+        else:
+            self._reap_background_io(wait=True)
+    
+    def append_stats_record(self):
+        """Append the running totals as one packed record to the stats file,
+        rotating the file to <file>.1 once it reaches STATS_FILE_MAX_BYTES."""
+        try:
+            try:
+                if os.path.getsize(self.stats_file) >= self.STATS_FILE_MAX_BYTES:
+                    os.replace(self.stats_file, self.stats_file + '.1')
+            except FileNotFoundError:
+                pass
+            with open(self.stats_file, 'ab') as f:
+                f.write(self.STATS_RECORD.pack(
+                    self.total_ranges_verified,
+                    self.total_numbers_checked,
+                    self.total_compute_time,
+                    time.time()
+                ))
+        except OSError as e:
+            print(f"[WORKER] ⚠️ Could not write stats record: {e}")
+    
+    @classmethod
+    def read_stats_records(cls, stats_file: str):
+        """Yield (ranges_verified, numbers_checked, compute_time, timestamp)
+        records from a stats file, oldest first, starting with its rotated
+        predecessor. A partially written trailing record is ignored."""
+        record_size = cls.STATS_RECORD.size
+        for path in (stats_file + '.1', stats_file):
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            yield from cls.STATS_RECORD.iter_unpack(data[:len(data) - len(data) % record_size])
     
     def show_statistics(self):
         """Show current session statistics."""
@@ -465,7 +685,7 @@ class DistributedCollatzWorker:
         
         print(f"\n[WORKER] 📊 Session Statistics:")
         print(f"[WORKER]   Ranges verified: {self.total_ranges_verified}")
-        print(f"[WORKER]   Numbers checked: {self.total_numbers_checked:,}")
+        print(f"[WORKER]   Numbers checked: {_fmt(self.total_numbers_checked)}")
         print(f"[WORKER]   Compute time: {self.total_compute_time:.1f}s")
         if self.total_compute_time > 0:
             print(f"[WORKER]   Average rate: {self.total_numbers_checked / self.total_compute_time:,.0f} odd/sec")
@@ -483,12 +703,34 @@ class DistributedCollatzWorker:
         """Show final statistics before shutdown."""
         self.show_statistics()
         
-        # Show network statistics
+        # Show network statistics (only values that changed since last shown)
         print(f"[WORKER] 🌐 Network Statistics:")
         network_stats = self.coordinator.get_network_statistics()
+        last_stats = self._last_net_stats
         for key, value in network_stats.items():
-            if isinstance(value, (int, float)):
-                print(f"[WORKER]   {key}: {value:,}" if isinstance(value, int) else f"[WORKER]   {key}: {value:.2f}")
+            if isinstance(value, (int, float)) and last_stats.get(key) != value:
+                print(f"[WORKER]   {key}: {_fmt(value)}" if isinstance(value, int) else f"[WORKER]   {key}: {value:.2f}")
+        self._last_net_stats = network_stats
+
+
+def show_stats_history() -> int:
+    """Print a summary of every worker stats file in the current directory."""
+    stats_files = sorted(glob.glob("worker_stats_*.bin"))
+    if not stats_files:
+        print("[STATS] No worker stats files found")
+        return 1
+    for stats_file in stats_files:
+        records = list(DistributedCollatzWorker.read_stats_records(stats_file))
+        if not records:
+            continue
+        first, last = records[0], records[-1]
+        # Totals restart with each worker session, so count each drop as a new one
+        sessions = 1 + sum(1 for prev, cur in zip(records, records[1:]) if cur[0] < prev[0])
+        print(f"[STATS] {stats_file}: {len(records)} records, {sessions} session(s)")
+        print(f"[STATS]   From {datetime.fromtimestamp(first[3]):%Y-%m-%d %H:%M} "
+              f"to {datetime.fromtimestamp(last[3]):%Y-%m-%d %H:%M}")
+        print(f"[STATS]   Last session: {last[0]} ranges, {_fmt(last[1])} numbers, {last[2]:.1f}s compute")
+    return 0
 
 
 def main():
@@ -508,9 +750,18 @@ def main():
                        help='Number of work assignments to complete (default: infinite)')
     parser.add_argument('--generate-work', type=int, metavar='N',
                        help='Generate N new work assignments at the frontier')
+    parser.add_argument('--stats-interval', type=int, default=10, metavar='N',
+                       help='Print session statistics every N verified ranges (default: 10)')
+    parser.add_argument('--stats-history', action='store_true',
+                       help='Summarize the worker_stats_*.bin files in this directory and exit')
+    parser.add_argument('--auto-vote', choices=['continue', 'shutdown', 'prompt'], default='prompt',
+                       help='Counterexample vote for headless nodes (default: prompt)')
     
     args = parser.parse_args()
     
+    if args.stats_history:
+        return show_stats_history()
+    
     # Handle user account creation
     if args.create_account:
         print(f"[ACCOUNT] Creating new user account: {args.create_account}")
@@ -587,7 +838,9 @@ def main():
             ipfs_api=args.ipfs_api,
             use_gpu=not args.cpu_only,
             worker_name=args.name,
-            user_key_file=args.user_key
+            user_key_file=args.user_key,
+            stats_interval=args.stats_interval,
+            auto_vote=args.auto_vote
         )
     except Exception as e:
         print(f"[ERROR] Failed to initialize worker: {e}")
@@ -598,15 +851,19 @@ def main():
             print(f"  3. User key file exists: {args.user_key}")
         return 1
     
-    # Generate work if requested (any peer can generate work in decentralized network)
-    if args.generate_work:
-        print(f"[WORKER] Generating {args.generate_work} new work assignments...")
-        assignments = worker.coordinator.generate_work_frontier(num_assignments=args.generate_work)
-        print(f"[WORKER] ✅ Generated {len(assignments)} assignments")
-        return 0
+    # SIGTERM unwinds like Ctrl+C, so the with-block below releases connections
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     
-    # Run worker loop
-    worker.run_worker_loop(num_iterations=args.iterations)
+    with worker:
+        # Generate work if requested (any peer can generate work in decentralized network)
+        if args.generate_work:
+            print(f"[WORKER] Generating {args.generate_work} new work assignments...")
+            assignments = worker.coordinator.generate_work_frontier(num_assignments=args.generate_work)
+            print(f"[WORKER] ✅ Generated {len(assignments)} assignments")
+            return 0
+        
+        # Run worker loop
+        worker.run_worker_loop(num_iterations=args.iterations)
     
     return 0
 
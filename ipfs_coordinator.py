@@ -66,6 +66,10 @@ class VerificationProof:
     ipfs_cid: str  # CID of detailed proof data
     signature: str  # Cryptographic signature
 
+    def to_dict(self) -> Dict:
+        """Shallow dict of the fields; all flat scalars, so no asdict() walk needed."""
+        return vars(self).copy()
+
 
 class IPFSCoordinator:
     """
@@ -87,16 +91,23 @@ class IPFSCoordinator:
     WORK_BUFFER_SIZE = 50  # Keep 50 assignments available (auto-generate more)
     GOSSIP_INTERVAL = 60  # Sync with peers every 60 seconds
     
-    def __init__(self, ipfs_api: str = '/ip4/127.0.0.1/tcp/5001'):
-        """Initialize IPFS coordinator (fully decentralized)."""
+    def __init__(self, ipfs_api: str = '/ip4/127.0.0.1/tcp/5001',
+                 trust_system: Optional[TrustSystem] = None):
+        """Initialize IPFS coordinator (fully decentralized).
+        
+        Pass the process's existing TrustSystem, if there is one: each
+        instance has its own writer thread on trust_database.json and its
+        change log, so two in one process would overwrite each other."""
         if not IPFS_AVAILABLE:
             raise ImportError("ipfshttpclient not available")
         
-        self.client = ipfshttpclient.connect(ipfs_api)
+        # session=True keeps one HTTP keep-alive connection pool for every
+        # API call instead of reconnecting per request; released by close()
+        self.client = ipfshttpclient.connect(ipfs_api, session=True)
         self.node_id = self.client.id()['ID']
         
         # 🔒 SECURITY: Trust system for consensus validation
-        self.trust_system = TrustSystem()
+        self.trust_system = trust_system if trust_system is not None else TrustSystem()
         
         # Local state (synced via gossip)
         self.work_assignments: Dict[str, WorkAssignment] = {}
@@ -282,7 +293,7 @@ class IPFSCoordinator:
             state = {
                 'global_highest_proven': self.global_highest_proven,
                 'work_assignments': [asdict(a) for a in self.work_assignments.values()],
-                'verification_proofs': [asdict(p) for p in self.verification_proofs.values()],
+                'verification_proofs': [p.to_dict() for p in self.verification_proofs.values()],
                 'published_by': self.node_id,
                 'timestamp': time.time(),
                 'network_stats': {
@@ -583,6 +594,13 @@ class IPFSCoordinator:
         
         return assignments
     
+    def close(self):
+        """Close the persistent IPFS API session."""
+        try:
+            self.client.close()
+        except Exception as e:
+            print(f"[IPFS] ⚠️ Error closing IPFS session: {e}")
+    
     def register_worker_availability(self, worker_id: str, user_id: Optional[str] = None):
         """
         Register worker as available for random assignment.
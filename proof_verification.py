@@ -16,10 +16,14 @@ Security features:
 """
 
 import json
+import math
 import hashlib
 import time
+import functools
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 try:
     from cryptography.hazmat.primitives.asymmetric import ed25519
@@ -30,9 +34,87 @@ except ImportError:
     CRYPTO_AVAILABLE = False
     print("[CRYPTO] cryptography not installed. Run: pip install cryptography")
 
+# Optional C-level JSON encoder for proofs published to IPFS
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from trust_system import TrustSystem, VerificationResult, TrustLevel
 
 
+@functools.lru_cache(maxsize=4096)
+def _load_public_key(pem: str):
+    """Parse a PEM public key; workers reuse one key for every proof, so cache it."""
+    return serialization.load_pem_public_key(pem.encode('utf-8'))
+
+
+# Signed proof fields, in the sorted-key order canonical JSON puts them
+PROOF_FIELDS = ('all_converged', 'compute_time', 'ipfs_cid', 'max_steps', 'numbers_checked',
+                'range_end', 'range_start', 'timestamp', 'worker_id')
+_PROOF_FIELD_SET = frozenset(PROOF_FIELDS)
+_json_str = json.encoder.encode_basestring_ascii
+_isfinite = math.isfinite
+
+# Canonical JSON of the signed fields as one format template (ints via %d,
+# floats via %s which is float repr, strings pre-escaped)
+_PROOF_TEMPLATE = ('{"all_converged":%s,"compute_time":%s,"ipfs_cid":%s,"max_steps":%d,'
+                   '"numbers_checked":%d,"range_end":%d,"range_start":%d,"timestamp":%s,'
+                   '"worker_id":%s}')
+
+
+def _canonical_proof_bytes(worker_id, range_start, range_end, all_converged, numbers_checked,
+                           max_steps, compute_time, timestamp, ipfs_cid) -> bytes:
+    """
+    Canonical bytes of the signed proof fields, taken positionally.
+    Byte-for-byte what json.dumps(sort_keys=True, separators=(',', ':')) gives,
+    so existing signatures stay valid, but written out directly for the fixed
+    schema. Values outside plain str/int/float/bool fall back to json.dumps.
+    """
+    try:
+        if not (type(all_converged) is bool and type(range_start) is int
+                and type(range_end) is int and type(numbers_checked) is int
+                and type(max_steps) is int
+                and (type(compute_time) is int or type(compute_time) is float and _isfinite(compute_time))
+                and (type(timestamp) is int or type(timestamp) is float and _isfinite(timestamp))):
+            raise TypeError
+        return (_PROOF_TEMPLATE % ('true' if all_converged else 'false', compute_time, _json_str(ipfs_cid),
+                                   max_steps, numbers_checked, range_end, range_start, timestamp,
+                                   _json_str(worker_id))).encode('ascii')
+    except TypeError:
+        proof_data = {
+            'worker_id': worker_id, 'range_start': range_start, 'range_end': range_end,
+            'all_converged': all_converged, 'numbers_checked': numbers_checked,
+            'max_steps': max_steps, 'compute_time': compute_time,
+            'timestamp': timestamp, 'ipfs_cid': ipfs_cid
+        }
+        return json.dumps(proof_data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _canonicalize_proof(proof_data: Dict) -> bytes:
+    """Canonical bytes of a proof data dict (any other key set goes through json.dumps)."""
+    if proof_data.keys() == _PROOF_FIELD_SET:
+        return _canonical_proof_bytes(**proof_data)
+    return json.dumps(proof_data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def proof_json_bytes(obj) -> bytes:
+    """Encode a proof the way ipfshttpclient's add_json does (sorted keys,
+    compact), using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # orjson stops at 64-bit ints; range bounds can exceed that
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _proof_digest(*fields) -> bytes:
+    """SHA-256 of the canonical proof; fields in _canonical_proof_bytes order."""
+    return hashlib.sha256(_canonical_proof_bytes(*fields)).digest()
+
+
 @dataclass
 class SignedProof:
     """A cryptographically signed verification proof."""
@@ -54,8 +136,22 @@ class SignedProof:
     proof_hash: str      # SHA-256 hash of proof data
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (flat fields, so no asdict() deep copy)."""
+        return {
+            'worker_id': self.worker_id,
+            'user_id': self.user_id,
+            'range_start': self.range_start,
+            'range_end': self.range_end,
+            'all_converged': self.all_converged,
+            'numbers_checked': self.numbers_checked,
+            'max_steps': self.max_steps,
+            'compute_time': self.compute_time,
+            'timestamp': self.timestamp,
+            'ipfs_cid': self.ipfs_cid,
+            'public_key_pem': self.public_key_pem,
+            'signature_hex': self.signature_hex,
+            'proof_hash': self.proof_hash
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'SignedProof':
@@ -66,6 +162,13 @@ class SignedProof:
 class ProofVerificationSystem:
     """Verifies and cross-checks worker proofs."""
     
+    # Accepted proof timestamp window (seconds)
+    MAX_CLOCK_SKEW = 300         # 5 min tolerance for clocks running ahead
+    MAX_PROOF_AGE = 86400 * 7    # 7 days before a proof is stale
+    
+    # Distinct proofs whose verdict is remembered for duplicate submissions
+    VALIDATION_CACHE_SIZE = 100000
+    
     def __init__(self, trust_system: TrustSystem):
         """Initialize verification system."""
         if not CRYPTO_AVAILABLE:
@@ -75,10 +178,15 @@ class ProofVerificationSystem:
         
         # Worker key storage (public keys only)
         self.worker_keys: Dict[str, ed25519.Ed25519PublicKey] = {}
+        self.worker_key_pems: Dict[str, str] = {}  # PEM each key was registered from
         
         # Pending cross-verifications
         self.pending_cross_checks: Dict[Tuple[int, int], List[SignedProof]] = {}
         
+        # Hash/signature verdicts of recently validated proofs (LRU)
+        self._validation_cache: OrderedDict = OrderedDict()
+        self._validation_lock = threading.Lock()
+        
         print("[VERIFY] Proof verification system initialized")
     
     def generate_worker_keypair(self) -> Tuple[ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey]:
@@ -101,27 +209,28 @@ class ProofVerificationSystem:
     
     def deserialize_public_key(self, pem: str) -> ed25519.Ed25519PublicKey:
         """Deserialize public key from PEM format."""
-        public_key = serialization.load_pem_public_key(pem.encode('utf-8'))
-        return public_key
+        return _load_public_key(pem)
     
     def register_worker_key(self, worker_id: str, public_key_pem: str):
         """Register a worker's public key."""
         try:
             public_key = self.deserialize_public_key(public_key_pem)
             self.worker_keys[worker_id] = public_key
+            self.worker_key_pems[worker_id] = public_key_pem
             print(f"[VERIFY] Registered public key for worker {worker_id[:16]}...")
         except Exception as e:
             print(f"[VERIFY] Error registering key for worker {worker_id[:16]}...: {e}")
     
-    def compute_proof_hash(self, proof_data: Dict) -> str:
+    def compute_proof_hash_bytes(self, proof_data: Dict) -> bytes:
         """
-        Compute SHA-256 hash of proof data.
+        Compute SHA-256 digest of proof data (raw 32 bytes, what gets signed).
         Ensures integrity - any tampering changes the hash.
         """
-        # Canonical JSON (sorted keys, no whitespace)
-        canonical = json.dumps(proof_data, sort_keys=True, separators=(',', ':'))
-        hash_bytes = hashlib.sha256(canonical.encode('utf-8')).digest()
-        return hash_bytes.hex()
+        return hashlib.sha256(_canonicalize_proof(proof_data)).digest()
+    
+    def compute_proof_hash(self, proof_data: Dict) -> str:
+        """Hex SHA-256 of proof data, as stored in SignedProof.proof_hash."""
+        return self.compute_proof_hash_bytes(proof_data).hex()
     
     def sign_proof(self, private_key: ed25519.Ed25519PrivateKey, 
                    proof_data: Dict) -> str:
@@ -129,12 +238,8 @@ class ProofVerificationSystem:
         Sign proof data with worker's private key.
         Returns signature as hex string.
         """
-        # Compute hash
-        proof_hash = self.compute_proof_hash(proof_data)
-        hash_bytes = bytes.fromhex(proof_hash)
-        
         # Sign the hash
-        signature = private_key.sign(hash_bytes)
+        signature = private_key.sign(self.compute_proof_hash_bytes(proof_data))
         return signature.hex()
     
     def verify_signature(self, public_key_pem: str, proof_data: Dict, 
@@ -146,15 +251,21 @@ class ProofVerificationSystem:
         try:
             # Deserialize public key
             public_key = self.deserialize_public_key(public_key_pem)
-            
-            # Compute proof hash
-            proof_hash = self.compute_proof_hash(proof_data)
-            hash_bytes = bytes.fromhex(proof_hash)
-            
-            # Verify signature
-            signature = bytes.fromhex(signature_hex)
-            public_key.verify(signature, hash_bytes)
-            
+        except Exception as e:
+            print(f"[VERIFY] Error verifying signature: {e}")
+            return False
+        
+        return self.verify_signature_with_digest(public_key, self.compute_proof_hash_bytes(proof_data),
+                                                 signature_hex)
+    
+    def verify_signature_with_digest(self, public_key: ed25519.Ed25519PublicKey, digest: bytes,
+                                     signature_hex: str) -> bool:
+        """
+        Verify a signature against an already-computed proof digest.
+        Returns True if valid, False otherwise.
+        """
+        try:
+            public_key.verify(bytes.fromhex(signature_hex), digest)
             return True
         except InvalidSignature:
             print(f"[VERIFY] ❌ Invalid signature detected!")
@@ -173,24 +284,16 @@ class ProofVerificationSystem:
         Create a signed proof from verification results.
         Worker calls this after completing verification.
         """
-        # Prepare proof data (everything except signature)
-        proof_data = {
-            'worker_id': worker_id,
-            'range_start': range_start,
-            'range_end': range_end,
-            'all_converged': all_converged,
-            'numbers_checked': numbers_checked,
-            'max_steps': max_steps,
-            'compute_time': compute_time,
-            'timestamp': time.time(),
-            'ipfs_cid': ipfs_cid
-        }
+        timestamp = time.time()
         
-        # Compute hash
-        proof_hash = self.compute_proof_hash(proof_data)
+        # Compute hash once over the signed fields (everything except signature);
+        # sign the raw digest, store its hex
+        digest = _proof_digest(worker_id, range_start, range_end, all_converged, numbers_checked,
+                               max_steps, compute_time, timestamp, ipfs_cid)
+        proof_hash = digest.hex()
         
         # Sign the hash
-        signature_hex = self.sign_proof(private_key, proof_data)
+        signature_hex = private_key.sign(digest).hex()
         
         # Get public key
         public_key = private_key.public_key()
@@ -206,7 +309,7 @@ class ProofVerificationSystem:
             numbers_checked=numbers_checked,
             max_steps=max_steps,
             compute_time=compute_time,
-            timestamp=proof_data['timestamp'],
+            timestamp=timestamp,
             ipfs_cid=ipfs_cid,
             public_key_pem=public_key_pem,
             signature_hex=signature_hex,
@@ -221,42 +324,23 @@ class ProofVerificationSystem:
     def validate_proof(self, signed_proof: SignedProof) -> Tuple[bool, str]:
         """
         Validate a signed proof.
-        Checks:
-        1. Signature is valid
-        2. Proof hash matches data
-        3. Timestamp is reasonable
-        4. Range is valid
+        Checks (cheap field checks first, so malformed proofs never reach the crypto):
+        1. Timestamp is reasonable
+        2. Range is valid
+        3. Key matches the worker's registered key
+        4. Proof hash matches data
+        5. Signature is valid
+        (4 and 5 are remembered for identical resubmissions)
         
         Returns (valid, error_message)
         """
-        # Check signature
-        proof_data = {
-            'worker_id': signed_proof.worker_id,
-            'range_start': signed_proof.range_start,
-            'range_end': signed_proof.range_end,
-            'all_converged': signed_proof.all_converged,
-            'numbers_checked': signed_proof.numbers_checked,
-            'max_steps': signed_proof.max_steps,
-            'compute_time': signed_proof.compute_time,
-            'timestamp': signed_proof.timestamp,
-            'ipfs_cid': signed_proof.ipfs_cid
-        }
-        
-        if not self.verify_signature(signed_proof.public_key_pem, proof_data, 
-                                     signed_proof.signature_hex):
-            return False, "Invalid cryptographic signature"
-        
-        # Check proof hash matches
-        computed_hash = self.compute_proof_hash(proof_data)
-        if computed_hash != signed_proof.proof_hash:
-            return False, "Proof hash mismatch (data tampering detected)"
-        
         # Check timestamp is reasonable (not future, not too old)
+        timestamp = signed_proof.timestamp
         current_time = time.time()
-        if signed_proof.timestamp > current_time + 300:  # 5 min tolerance
+        if timestamp > current_time + self.MAX_CLOCK_SKEW:
             return False, "Timestamp is in the future"
         
-        if current_time - signed_proof.timestamp > 86400 * 7:  # 7 days old
+        if timestamp < current_time - self.MAX_PROOF_AGE:
             return False, "Proof is too old (stale)"
         
         # Check range validity
@@ -272,6 +356,57 @@ class ProofVerificationSystem:
             # Allow 10% variance (for odd/even boundaries)
             return False, f"Numbers checked ({signed_proof.numbers_checked}) doesn't match range"
         
+        # Registered workers verify with their stored key; a different PEM
+        # means the key was rotated or spoofed, so reject rather than parse it
+        registered_pem = self.worker_key_pems.get(signed_proof.worker_id)
+        if registered_pem is not None and signed_proof.public_key_pem != registered_pem:
+            return False, "Public key does not match worker's registered key"
+        
+        canonical = _canonical_proof_bytes(signed_proof.worker_id, signed_proof.range_start,
+                                           signed_proof.range_end, signed_proof.all_converged,
+                                           signed_proof.numbers_checked, signed_proof.max_steps,
+                                           signed_proof.compute_time, signed_proof.timestamp,
+                                           signed_proof.ipfs_cid)
+        
+        # Gossip echoes and retries resend identical proofs: the hash/signature
+        # verdict depends only on these four values, so reuse it
+        cache_key = (canonical, signed_proof.proof_hash, signed_proof.signature_hex,
+                     signed_proof.public_key_pem)
+        with self._validation_lock:
+            verdict = self._validation_cache.get(cache_key)
+            if verdict is not None:
+                self._validation_cache.move_to_end(cache_key)
+                return verdict
+        
+        verdict = self._check_hash_and_signature(signed_proof, canonical, registered_pem is not None)
+        with self._validation_lock:
+            self._validation_cache[cache_key] = verdict
+            if len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        return verdict
+    
+    def _check_hash_and_signature(self, signed_proof: SignedProof, canonical: bytes,
+                                  registered: bool) -> Tuple[bool, str]:
+        """Hash check and Ed25519 verify for validate_proof (canonical bytes given)."""
+        # Hash once: compare against the claimed hash, then verify the signature over it
+        digest = hashlib.sha256(canonical).digest()
+        
+        # Check proof hash matches
+        if digest.hex() != signed_proof.proof_hash:
+            return False, "Proof hash mismatch (data tampering detected)"
+        
+        if registered:
+            public_key = self.worker_keys[signed_proof.worker_id]
+        else:
+            try:
+                public_key = self.deserialize_public_key(signed_proof.public_key_pem)
+            except Exception as e:
+                print(f"[VERIFY] Error verifying signature: {e}")
+                return False, "Invalid cryptographic signature"
+        
+        if not self.verify_signature_with_digest(public_key, digest, signed_proof.signature_hex):
+            return False, "Invalid cryptographic signature"
+        
         return True, "Proof is valid"
     
     def submit_for_consensus(self, signed_proof: SignedProof) -> Tuple[bool, str]:
@@ -287,7 +422,8 @@ class ProofVerificationSystem:
             if signed_proof.worker_id in self.trust_system.workers:
                 stats = self.trust_system.workers[signed_proof.worker_id]
                 stats.trust_level = TrustLevel.BANNED
-                self.trust_system.save_state()
+                # Deferred write: a flood of bad proofs must not mean a disk write each
+                self.trust_system.mark_dirty(signed_proof.worker_id)
             return False, f"Proof validation failed: {error}"
         
         print(f"[VERIFY] ✅ Proof validated for worker {signed_proof.worker_id[:16]}...")
@@ -332,15 +468,15 @@ class ProofVerificationSystem:
         if len(proofs) < 2:
             return None  # Need at least 2 to have a conflict
         
-        # Check if all results agree
-        results = [p.all_converged for p in proofs]
-        
-        if len(set(results)) > 1:
-            # Conflict detected!
-            print(f"[VERIFY] ⚠️ CONFLICT DETECTED in range {range_start:,} - {range_end:,}")
-            for proof in proofs:
-                print(f"[VERIFY]   Worker {proof.worker_id[:16]}... says: {proof.all_converged}")
-            return proofs
+        # Check if all results agree (stop at the first disagreement)
+        first = proofs[0].all_converged
+        for p in proofs:
+            if p.all_converged != first:
+                # Conflict detected!
+                print(f"[VERIFY] ⚠️ CONFLICT DETECTED in range {range_start:,} - {range_end:,}")
+                for proof in proofs:
+                    print(f"[VERIFY]   Worker {proof.worker_id[:16]}... says: {proof.all_converged}")
+                return proofs
         
         return None
     
@@ -353,14 +489,8 @@ class ProofVerificationSystem:
         """
         proofs = self.get_proofs_for_range(range_start, range_end)
         
-        correct_workers = []
-        incorrect_workers = []
-        
-        for proof in proofs:
-            if proof.all_converged == correct_result:
-                correct_workers.append(proof.worker_id)
-            else:
-                incorrect_workers.append(proof.worker_id)
+        correct_workers = [p.worker_id for p in proofs if p.all_converged == correct_result]
+        incorrect_workers = [p.worker_id for p in proofs if p.all_converged != correct_result]
         
         # Update trust system
         self.trust_system.resolve_conflict(
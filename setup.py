@@ -75,6 +75,12 @@ setup(
             # 'intel-extension-for-pytorch>=2.0.0',
         ],
         
+        # Optional native speedups (pure-Python fallbacks are used without them)
+        'speedups': [
+            'gmpy2>=2.1.0,<3.0.0',  # GMP big-int ops in the CPU checker
+            'orjson>=3.9.0,<4.0.0',  # Fast JSON for benchmark results
+        ],
+        
         # Development tools with version ranges
         'dev': [
             'pytest>=7.0.0,<9.0.0',
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark output parser tests.
+
+parse_checker_output reads the engine's status block through one
+alternation regex (_CHECKER_RE) whose group names double as result keys;
+parse_tuner_output uses the _TUNER_*_RE patterns for the auto-tuner's
+peak, config and stage lines, which record_tuner_update folds into the
+results. _pump_output thins the checker stream, but must never drop a rate
+line.
+"""
+
+import sys
+import os
+import io
+import tempfile
+import unittest
+import contextlib
+from queue import SimpleQueue
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark import (parse_checker_output, parse_tuner_output, record_tuner_update, _pump_output,
+                       CHECKER_SAMPLE_EVERY)
+
+
+class TestCheckerParser(unittest.TestCase):
+    """_CHECKER_RE fields, as printed by CollatzEngine's status block."""
+
+    def test_rates(self):
+        self.assertEqual(parse_checker_output("Current rate:    1,234,567 odd/s  (2,469,134 effective/s)"),
+                         {'current_rate_odd_per_sec': 1234567.0})
+        self.assertEqual(parse_checker_output("Average rate:    987,654 odd/s  (1,975,308 effective/s)"),
+                         {'average_rate_odd_per_sec': 987654.0})
+        self.assertEqual(parse_checker_output("Current rate: 1234.5 odd/s"),
+                         {'current_rate_odd_per_sec': 1234.5})
+        self.assertEqual(parse_checker_output("Current rate:    0 odd/s  (0 effective/s)"),
+                         {'current_rate_odd_per_sec': 0.0})
+
+    def test_counters_stay_strings(self):
+        self.assertEqual(parse_checker_output("Highest proven:  295,147,905,179,352,825,856"),
+                         {'highest_proven': '295,147,905,179,352,825,856'})
+        self.assertEqual(parse_checker_output("Session tested:  12,000,000"),
+                         {'session_tested': '12,000,000'})
+        self.assertEqual(parse_checker_output("Total tested:    98,765,432,100"),
+                         {'total_tested': '98,765,432,100'})
+
+    def test_several_fields_on_one_line(self):
+        line = "Highest proven: 1,000 | Current rate: 5,000 odd/s | Total tested: 42"
+        self.assertEqual(parse_checker_output(line), {
+            'highest_proven': '1,000',
+            'current_rate_odd_per_sec': 5000.0,
+            'total_tested': '42'
+        })
+
+    def test_other_lines(self):
+        for line in ("=" * 70, "SESSION SUMMARY - 12:30:01", "Session runtime: 1h 2m",
+                     "Max steps (session/ever): 1,000 / 2,000", "CPU workers:     64 numbers in queue",
+                     "Current rate: n/a", ""):
+            self.assertEqual(parse_checker_output(line), {}, line)
+
+
+class TestTunerParser(unittest.TestCase):
+    """_TUNER_PEAK_RE, _TUNER_CFG_RE and _TUNER_STAGE1_RE."""
+
+    def test_new_peak(self):
+        self.assertEqual(parse_tuner_output("[NEW PEAK] 1,234,567 odd/s"),
+                         {'new_peak_rate': 1234567.0})
+        self.assertEqual(parse_tuner_output("  [NEW BEST] Rate: 2,500,000.5 odd/s (5,000,001 effective/s)"),
+                         {'new_peak_rate': 2500000.5})
+
+    def test_config(self):
+        self.assertEqual(parse_tuner_output("Batch: 1,048,576 | Threads: 256"),
+                         {'config': {'batch_size': 1048576, 'threads': 256}})
+        self.assertEqual(parse_tuner_output("Testing Batch: 524,288 | Threads: 512 | Work: 4 | Blocks/SM: 8"),
+                         {'config': {'batch_size': 524288, 'threads': 512,
+                                     'work_multiplier': 4, 'blocks_per_sm': 8}})
+        self.assertEqual(parse_tuner_output("Batch: 65,536 | Threads: 128 | Blocks/SM: 2"),
+                         {'config': {'batch_size': 65536, 'threads': 128, 'blocks_per_sm': 2}})
+
+    def test_peak_with_config(self):
+        line = "[NEW PEAK] 3,000,000 odd/s - Batch: 2,097,152 | Threads: 256 | Work: 2"
+        self.assertEqual(parse_tuner_output(line), {
+            'new_peak_rate': 3000000.0,
+            'config': {'batch_size': 2097152, 'threads': 256, 'work_multiplier': 2}
+        })
+
+    def test_stage_1(self):
+        self.assertEqual(parse_tuner_output("STAGE 1 COMPLETE"), {'stage_1_complete': True})
+        self.assertEqual(parse_tuner_output("STAGE 1 COMPLETE - Best rate: 4,321,000 odd/s"),
+                         {'stage_1_complete': True, 'stage_1_best_rate': 4321000.0})
+
+    def test_other_lines(self):
+        for line in ("STAGE 2 starting", "Threads: 256", "Batch: 1,024", "[INFO] 1,000 odd/s", ""):
+            self.assertEqual(parse_tuner_output(line), {}, line)
+
+
+class TestTunerUpdates(unittest.TestCase):
+    """record_tuner_update, as run_benchmark's main loop calls it per tuner line."""
+
+    def feed(self, lines):
+        results = {"last_tuner_config": None, "tuner_peaks": []}
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for elapsed, line in enumerate(lines):
+                parsed = parse_tuner_output(line)
+                if parsed:
+                    record_tuner_update(results, parsed, float(elapsed))
+        return results, output.getvalue()
+
+    def test_bare_stage_1_complete(self):
+        results, output = self.feed(["STAGE 1 COMPLETE"])
+        self.assertIn("[STAGE 1] Complete!", output)
+        self.assertNotIn("Best", output)
+
+    def test_stage_1_complete_with_rate(self):
+        results, output = self.feed(["STAGE 1 COMPLETE - Best rate: 4,321,000 odd/s"])
+        self.assertIn("[STAGE 1] Complete! Best: 4,321,000 odd/s", output)
+
+    def test_peaks_and_config(self):
+        results, output = self.feed(["Batch: 1,024 | Threads: 128",
+                                     "[NEW PEAK] 3,000,000 odd/s - Batch: 2,048 | Threads: 256",
+                                     "STAGE 1 COMPLETE"])
+        self.assertEqual(results["last_tuner_config"], {'batch_size': 2048, 'threads': 256})
+        self.assertEqual(results["tuner_peaks"], [{"rate": 3000000.0, "timestamp": 1.0}])
+        self.assertIn("[PEAK] New peak: 3,000,000 odd/s", output)
+
+
+class TestCheckerSampling(unittest.TestCase):
+    """_pump_output with the checker's sampling enabled."""
+
+    def status_block(self, rate):
+        # Same 12-line layout as CollatzEngine's GPU status display
+        return ["=" * 70, "SESSION SUMMARY - 12:00:00", "=" * 70,
+                "Highest proven:  1,000", "Session tested:  2,000",
+                f"Average rate:    {rate:,} odd/s  ({2 * rate:,} effective/s)",
+                f"Current rate:    {rate:,} odd/s  ({2 * rate:,} effective/s)",
+                "Total tested:    3,000", "Session runtime: 1m", "Total runtime:   1m",
+                "Max steps (session/ever): 10 / 20", "=" * 70]
+
+    def pump(self, lines):
+        out_queue = SimpleQueue()
+        with tempfile.TemporaryFile() as stream:
+            stream.write(("\n".join(lines) + "\n").encode())
+            stream.seek(0)
+            _pump_output('checker', stream, parse_checker_output, out_queue, io.StringIO(),
+                         CHECKER_SAMPLE_EVERY)
+        parsed = []
+        while not out_queue.empty():
+            parsed.append(out_queue.get()[1])
+        return parsed
+
+    def test_rate_lines_never_skipped(self):
+        rates = [1000 + (i * 37) % 500 for i in range(300)]
+        # Any header offset in front of the repeating block
+        for offset in range(12):
+            lines = ["starting"] * offset
+            for rate in rates:
+                lines.extend(self.status_block(rate))
+            parsed = self.pump(lines)
+            current = [p['current_rate_odd_per_sec'] for p in parsed if 'current_rate_odd_per_sec' in p]
+            self.assertEqual(current, [float(r) for r in rates], offset)
+            seen = set().union(*parsed)
+            self.assertEqual(seen, {'current_rate_odd_per_sec', 'average_rate_odd_per_sec',
+                                    'highest_proven', 'session_tested', 'total_tested'}, offset)
+
+
+if __name__ == '__main__':
+    unittest.main()
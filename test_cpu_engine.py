@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+CPU engine tests.
+
+worker_check_range steps whole blocks in uint64 NumPy lanes
+(collatz_block_vectorized) and re-checks only the numbers the lanes could
+not settle with the scalar collatz_check_cpu. Both branches must give the
+same answer as the plain scalar loop. Numbers reach the CPU workers packed
+by pack_numbers, which must round-trip values wider than 64 bits.
+"""
+
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import CollatzEngine
+from CollatzEngine import (collatz_block_vectorized, collatz_check_cpu, worker_check_range,
+                           pack_numbers, unpack_numbers, CPU_VECTOR_BLOCK, CPU_TASK_BATCH,
+                           _U64_STEP_LIMIT)
+
+
+def scalar_worker_check_range(args):
+    """worker_check_range with the NumPy branch switched off."""
+    with mock.patch.object(CollatzEngine, '_U64_STEP_LIMIT', 0):
+        return worker_check_range(args)
+
+
+def reference_unsettled(first, count, highest_proven, limit=_U64_STEP_LIMIT):
+    """Offsets the lanes should hand back: those whose shortcut trajectory hits
+    an odd value above limit before dropping to highest_proven (or 1)."""
+    floor = max(highest_proven, 1)
+    unsettled = []
+    for offset in range(count):
+        n = first + offset
+        while n > floor:
+            if n & 1:
+                if n > limit:
+                    unsettled.append(offset)
+                    break
+                n = (3 * n + 1) >> 1
+            else:
+                n >>= 1
+    return unsettled
+
+
+class TestVectorizedBlock(unittest.TestCase):
+    """collatz_block_vectorized against the scalar checker."""
+
+    def test_small_numbers_settle_in_lanes(self):
+        for first in range(1, 200000, CPU_VECTOR_BLOCK):
+            count = min(CPU_VECTOR_BLOCK, 200000 - first)
+            self.assertEqual(len(collatz_block_vectorized(first, count, 0)), 0)
+
+    def test_never_settles_what_scalar_rejects(self):
+        # With a tight step limit the scalar checker rejects many numbers;
+        # every one of them must come back from the lanes for a re-check
+        max_steps = 60
+        first, count = 1, 20000
+        unsettled = set(collatz_block_vectorized(first, count, 0, max_steps).tolist())
+        rejected = [offset for offset in range(count)
+                    if not collatz_check_cpu(first + offset, 0, max_steps)[0]]
+        self.assertTrue(rejected)
+        self.assertFalse(set(rejected) - unsettled)
+
+    def test_overflow_falls_back(self):
+        first, count = _U64_STEP_LIMIT - 3000, 3000
+        highest_proven = first - 1
+        unsettled = collatz_block_vectorized(first, count, highest_proven)
+        self.assertEqual(unsettled.tolist(), reference_unsettled(first, count, highest_proven))
+        self.assertTrue(len(unsettled))
+
+    def test_overflow_with_low_limit(self):
+        with mock.patch.object(CollatzEngine, '_U64_STEP_LIMIT', 10000):
+            unsettled = collatz_block_vectorized(1, 5000, 0)
+        self.assertEqual(unsettled.tolist(), reference_unsettled(1, 5000, 0, limit=10000))
+        self.assertTrue(len(unsettled))
+
+
+class TestWorkerCheckRange(unittest.TestCase):
+    """Vectorized and scalar branches of worker_check_range agree."""
+
+    def assertBranchesAgree(self, args):
+        vectorized = worker_check_range(args)
+        self.assertEqual(vectorized, scalar_worker_check_range(args))
+        return vectorized
+
+    def test_range_below_200000(self):
+        for start in range(1, 200000, CPU_VECTOR_BLOCK * 2):
+            count = min(CPU_VECTOR_BLOCK * 2, 200000 - start)
+            for highest_proven in (0, start - 1):
+                result = self.assertBranchesAgree((start, count, highest_proven))
+                self.assertEqual(result, {'counterexample': None, 'numbers_checked': count})
+
+    def test_block_with_scalar_fallback(self):
+        start = _U64_STEP_LIMIT - 4000
+        result = self.assertBranchesAgree((start, 4000, start - 1))
+        self.assertEqual(result, {'counterexample': None, 'numbers_checked': 4000})
+
+    def test_counterexample_reported_the_same(self):
+        # Reject a number the lanes hand back to the scalar checker, so the
+        # vectorized branch reaches it too
+        start = _U64_STEP_LIMIT - 4000
+        fallback = reference_unsettled(start, 4000, start - 1)
+        bad = start + fallback[len(fallback) // 2]
+
+        def fake_check(n, highest_proven):
+            if n == bad:
+                return (False, 1, 'step_limit')
+            return collatz_check_cpu(n, highest_proven)
+
+        with mock.patch.object(CollatzEngine, 'collatz_check_cpu', fake_check):
+            result = self.assertBranchesAgree((start, 4000, start - 1))
+        self.assertEqual(result, {'counterexample': bad, 'numbers_checked': bad - start,
+                                  'reason': 'step_limit'})
+
+
+class TestTaskPacking(unittest.TestCase):
+    """pack_numbers / unpack_numbers round trips for the CPU task queue."""
+
+    def assertRoundTrip(self, numbers):
+        self.assertEqual(unpack_numbers(pack_numbers(numbers)), list(numbers))
+
+    def test_small_values(self):
+        self.assertRoundTrip([0])
+        self.assertRoundTrip([1, 3, 5, 7, 255])
+        self.assertRoundTrip([256, 65535, 65536])
+
+    def test_word_boundaries(self):
+        for bits in (63, 64, 65, 127, 128, 129):
+            self.assertRoundTrip([2**bits - 1, 2**bits, 2**bits + 1, 1])
+
+    def test_mixed_widths_share_the_widest(self):
+        numbers = [1, 2**70 + 3, 0, 12345]
+        payload = pack_numbers(numbers)
+        self.assertEqual(payload[0], 9)
+        self.assertEqual(len(payload), 1 + 9 * len(numbers))
+        self.assertRoundTrip(numbers)
+
+    def test_queue_batches(self):
+        # queue_numbers packs range objects of CPU_TASK_BATCH odd numbers
+        for first in (1, 2**64 + 1, 10**30 + 1):
+            self.assertRoundTrip(range(first, first + 2 * CPU_TASK_BATCH, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Canonical proof encoding tests.
+
+Signatures are made over SHA-256 of the signed proof fields encoded as
+json.dumps(sort_keys=True, separators=(',', ':')). The hand-built encoder in
+proof_verification must reproduce those bytes exactly, or every proof signed
+before it stops verifying.
+"""
+
+import sys
+import os
+import json
+import random
+import shutil
+import hashlib
+import tempfile
+import unittest
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from proof_verification import (PROOF_FIELDS, CRYPTO_AVAILABLE, _canonical_proof_bytes,
+                                _canonicalize_proof, _proof_digest)
+
+
+def legacy_bytes(proof_data):
+    """The encoding proofs were originally hashed with."""
+    return json.dumps(proof_data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def make_proof(worker_id='QmWorker', range_start=1000000, range_end=1010000, all_converged=True,
+               numbers_checked=5000, max_steps=10000, compute_time=15.5, timestamp=1761601870.123456,
+               ipfs_cid='QmExampleCID'):
+    return {
+        'worker_id': worker_id, 'range_start': range_start, 'range_end': range_end,
+        'all_converged': all_converged, 'numbers_checked': numbers_checked,
+        'max_steps': max_steps, 'compute_time': compute_time,
+        'timestamp': timestamp, 'ipfs_cid': ipfs_cid
+    }
+
+
+class TestCanonicalProofBytes(unittest.TestCase):
+    """_canonical_proof_bytes must match json.dumps(sort_keys=True) byte for byte."""
+
+    def assertMatchesLegacy(self, proof_data):
+        fields = [proof_data[k] for k in ('worker_id', 'range_start', 'range_end', 'all_converged',
+                                          'numbers_checked', 'max_steps', 'compute_time',
+                                          'timestamp', 'ipfs_cid')]
+        expected = legacy_bytes(proof_data)
+        self.assertEqual(_canonical_proof_bytes(*fields), expected)
+        self.assertEqual(_canonicalize_proof(proof_data), expected)
+        self.assertEqual(_proof_digest(*fields), hashlib.sha256(expected).digest())
+
+    def test_field_order_is_sorted(self):
+        self.assertEqual(list(PROOF_FIELDS), sorted(PROOF_FIELDS))
+
+    def test_typical_proof(self):
+        self.assertMatchesLegacy(make_proof())
+
+    def test_large_ints(self):
+        # Range bounds past 2**64 are expected at the frontier
+        self.assertMatchesLegacy(make_proof(range_start=2**68 + 1, range_end=2**68 + 2**20,
+                                            numbers_checked=2**19, max_steps=2**40))
+        self.assertMatchesLegacy(make_proof(range_start=10**40, range_end=10**40 + 7))
+
+    def test_floats(self):
+        for value in (0.0, -0.0, 1e-7, 1e16, 1e22, 123456789.98765432, 0.1 + 0.2, 5e-324, 15):
+            self.assertMatchesLegacy(make_proof(compute_time=value, timestamp=value))
+
+    def test_non_finite_floats(self):
+        for value in (float('inf'), float('-inf'), float('nan')):
+            self.assertMatchesLegacy(make_proof(compute_time=value))
+
+    def test_none_ipfs_cid(self):
+        self.assertMatchesLegacy(make_proof(ipfs_cid=None))
+
+    def test_non_ascii_worker_id(self):
+        for worker_id in ('wörker-ß', 'узел-1', '工作节点', 'emoji-🚀', 'quote"back\\slash\n\t\x00'):
+            self.assertMatchesLegacy(make_proof(worker_id=worker_id, ipfs_cid=worker_id[::-1]))
+
+    def test_unusual_types_fall_back(self):
+        self.assertMatchesLegacy(make_proof(all_converged=1, numbers_checked=True))
+        self.assertMatchesLegacy(make_proof(range_start=1.5, max_steps=None))
+
+    def test_other_key_sets_use_json(self):
+        proof_data = make_proof()
+        proof_data['extra'] = [1, 2, 3]
+        self.assertEqual(_canonicalize_proof(proof_data), legacy_bytes(proof_data))
+        del proof_data['extra'], proof_data['ipfs_cid']
+        self.assertEqual(_canonicalize_proof(proof_data), legacy_bytes(proof_data))
+
+    def test_randomized(self):
+        rng = random.Random(20251027)
+        alphabet = 'abcXYZ019 _-"\\/\né中\U0001f600'
+
+        def text():
+            return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+
+        def number():
+            return rng.choice((rng.randint(0, 2**31), rng.randint(0, 2**64), rng.randint(2**64, 2**128)))
+
+        def real():
+            return rng.choice((rng.random() * 10 ** rng.randint(-8, 20), float(rng.randint(0, 2**53)),
+                               rng.uniform(1.6e9, 1.9e9), rng.randint(0, 100)))
+
+        for _ in range(5000):
+            start = number()
+            self.assertMatchesLegacy(make_proof(
+                worker_id=text(), range_start=start, range_end=start + number(),
+                all_converged=rng.random() < 0.5, numbers_checked=number(), max_steps=number(),
+                compute_time=real(), timestamp=real(),
+                ipfs_cid=text() if rng.random() < 0.9 else None))
+
+
+@unittest.skipUnless(CRYPTO_AVAILABLE, "cryptography not installed")
+class TestProofHashCompatibility(unittest.TestCase):
+    """Hashes and signatures agree with the legacy json.dumps encoding."""
+
+    @classmethod
+    def setUpClass(cls):
+        from proof_verification import ProofVerificationSystem
+        from trust_system import TrustSystem
+        cls.tmpdir = tempfile.mkdtemp()
+        trust = TrustSystem(storage_file=os.path.join(cls.tmpdir, 'trust.json'))
+        cls.verifier = ProofVerificationSystem(trust)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.verifier.trust_system.flush()
+        shutil.rmtree(cls.tmpdir, ignore_errors=True)
+
+    def test_compute_proof_hash_matches_legacy(self):
+        for proof_data in (make_proof(), make_proof(range_end=2**70, ipfs_cid=None),
+                           make_proof(worker_id='节点', compute_time=0.1 + 0.2)):
+            self.assertEqual(self.verifier.compute_proof_hash(proof_data),
+                             hashlib.sha256(legacy_bytes(proof_data)).hexdigest())
+
+    def test_signature_over_legacy_digest_verifies(self):
+        private_key, public_key = self.verifier.generate_worker_keypair()
+        pem = self.verifier.serialize_public_key(public_key)
+        proof_data = make_proof(worker_id='wörker', range_start=2**65, range_end=2**65 + 10)
+        signature_hex = private_key.sign(hashlib.sha256(legacy_bytes(proof_data)).digest()).hex()
+        self.assertTrue(self.verifier.verify_signature(pem, proof_data, signature_hex))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Trust database persistence tests.
+
+TrustSystem keeps a full JSON snapshot plus an append-only change log of
+per-worker upserts. The log starts with a header naming the snapshot
+generation it applies to; load_state only replays a log whose generation
+matches the snapshot, and stops at a torn last line. A stale or torn log is
+folded into a new snapshot on load, so later appends start a clean log.
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from trust_system import TrustSystem, TrustLevel
+
+
+class TestTrustPersistence(unittest.TestCase):
+    """Snapshot + change log round trips through load_state."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.storage_file = os.path.join(self.tmpdir, 'trust_database.json')
+        self.log_file = os.path.join(self.tmpdir, 'trust_database.log')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def open_trust(self):
+        trust = TrustSystem(storage_file=self.storage_file)
+        self.addCleanup(trust.flush)
+        return trust
+
+    def read_log(self):
+        with open(self.log_file) as f:
+            return [json.loads(line) for line in f]
+
+    def update(self, trust, worker_id, correct):
+        stats = trust.workers[worker_id]
+        stats.correct_verifications = correct
+        stats.total_verifications = correct
+        trust.mark_dirty(worker_id)
+
+    def test_snapshot_log_round_trip(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a', 'user-1')
+        trust.register_worker('worker-b')
+        trust.save_state()
+        trust.flush()
+        self.assertFalse(os.path.exists(self.log_file))  # Snapshot truncates the log
+
+        self.update(trust, 'worker-a', 7)
+        trust.workers['worker-b'].trust_level = TrustLevel.VERIFIED
+        trust.mark_dirty('worker-b')
+        trust.register_worker('worker-c')
+        trust.flush()
+
+        header, *entries = self.read_log()
+        with open(self.storage_file) as f:
+            self.assertEqual(header['generation'], json.load(f)['log_generation'])
+        self.assertEqual({e['worker']['worker_id'] for e in entries}, {'worker-a', 'worker-b', 'worker-c'})
+
+        reloaded = self.open_trust()
+        self.assertEqual(set(reloaded.workers), {'worker-a', 'worker-b', 'worker-c'})
+        for worker_id, stats in trust.workers.items():
+            self.assertEqual(reloaded.workers[worker_id], stats)
+        self.assertEqual(reloaded.workers['worker-b'].trust_level, TrustLevel.VERIFIED)
+        self.assertEqual(reloaded.workers['worker-a'].user_id, 'user-1')
+
+    def test_log_only_without_snapshot(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.flush()
+        self.assertFalse(os.path.exists(self.storage_file))
+
+        reloaded = self.open_trust()
+        self.assertEqual(set(reloaded.workers), {'worker-a'})
+
+    def test_compaction_at_log_limit(self):
+        trust = self.open_trust()
+        trust.LOG_COMPACT_ENTRIES = 5
+        for i in range(4):
+            trust.register_worker(f'worker-{i}')
+            trust.flush()
+        self.assertEqual(len(self.read_log()), 1 + 4)
+        self.assertFalse(os.path.exists(self.storage_file))
+
+        # The next two updates would take the log past the limit: snapshot instead
+        trust.register_worker('worker-4')
+        trust.register_worker('worker-5')
+        trust.flush()
+        self.assertFalse(os.path.exists(self.log_file))
+        with open(self.storage_file) as f:
+            snapshot = json.load(f)
+        self.assertEqual(len(snapshot['workers']), 6)
+        self.assertEqual(snapshot['log_generation'], 1)
+
+        # Logging resumes against the new snapshot generation
+        self.update(trust, 'worker-0', 3)
+        trust.flush()
+        header, entry = self.read_log()
+        self.assertEqual(header['generation'], 1)
+        self.assertEqual(entry['worker']['correct_verifications'], 3)
+
+        reloaded = self.open_trust()
+        self.assertEqual(len(reloaded.workers), 6)
+        self.assertEqual(reloaded.workers['worker-0'].correct_verifications, 3)
+
+    def test_stale_log_is_ignored(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.save_state()
+        trust.flush()
+        self.update(trust, 'worker-a', 5)
+        trust.flush()
+        stale_log = self.read_log()
+
+        # A later snapshot folds the change in; put the old log back beside it
+        self.update(trust, 'worker-a', 9)
+        trust.save_state()
+        trust.flush()
+        with open(self.log_file, 'w') as f:
+            for entry in stale_log:
+                f.write(json.dumps(entry) + '\n')
+
+        reloaded = self.open_trust()
+        self.assertEqual(reloaded.workers['worker-a'].correct_verifications, 9)
+        self.assertFalse(os.path.exists(self.log_file))
+
+    def test_updates_after_stale_log_survive(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.save_state()
+        trust.flush()
+        with open(self.log_file, 'w') as f:
+            f.write(json.dumps({'generation': 0}) + '\n')
+
+        recovered = self.open_trust()
+        recovered.register_worker('worker-b')
+        self.update(recovered, 'worker-a', 6)
+        recovered.flush()
+
+        reloaded = self.open_trust()
+        self.assertEqual(set(reloaded.workers), {'worker-a', 'worker-b'})
+        self.assertEqual(reloaded.workers['worker-a'].correct_verifications, 6)
+
+    def test_truncated_last_line(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.register_worker('worker-b')
+        trust.save_state()
+        trust.flush()
+        self.update(trust, 'worker-a', 4)
+        trust.flush()
+
+        # Interrupted append: only part of an upsert for worker-b made it out
+        record = trust._worker_record(trust.workers['worker-b'])
+        record['correct_verifications'] = 99
+        torn = json.dumps({'op': 'upsert', 'worker': record})
+        with open(self.log_file, 'a') as f:
+            f.write(torn[:-2])
+
+        reloaded = self.open_trust()
+        self.assertEqual(reloaded.workers['worker-a'].correct_verifications, 4)
+        self.assertEqual(reloaded.workers['worker-b'].correct_verifications, 0)
+        self.assertFalse(os.path.exists(self.log_file))
+
+    def tear_log(self, trust, worker_id, keep):
+        """Append the first keep characters of an upsert line for worker_id."""
+        record = trust._worker_record(trust.workers[worker_id])
+        record['correct_verifications'] = 99
+        line = json.dumps({'op': 'upsert', 'worker': record}) + '\n'
+        with open(self.log_file, 'a') as f:
+            f.write(line[:keep])
+
+    def test_updates_after_torn_tail_survive(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.flush()
+        self.tear_log(trust, 'worker-a', 30)
+
+        # Recover, keep working, then restart again
+        recovered = self.open_trust()
+        recovered.register_worker('worker-b')
+        self.update(recovered, 'worker-a', 2)
+        recovered.flush()
+
+        reloaded = self.open_trust()
+        self.assertEqual(set(reloaded.workers), {'worker-a', 'worker-b'})
+        self.assertEqual(reloaded.workers['worker-a'].correct_verifications, 2)
+
+    def test_last_line_missing_newline(self):
+        trust = self.open_trust()
+        trust.register_worker('worker-a')
+        trust.flush()
+        self.tear_log(trust, 'worker-a', -1)  # Whole record, but no newline
+
+        recovered = self.open_trust()
+        self.assertEqual(recovered.workers['worker-a'].correct_verifications, 99)
+        recovered.register_worker('worker-b')
+        recovered.flush()
+
+        reloaded = self.open_trust()
+        self.assertEqual(set(reloaded.workers), {'worker-a', 'worker-b'})
+        self.assertEqual(reloaded.workers['worker-a'].correct_verifications, 99)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,14 +12,25 @@ Prevents Byzantine attacks and ensures result integrity through:
 - Consensus requirements before accepting results
 """
 
+import os
 import json
+import math
 import time
+import random
+import queue
+import heapq
+import atexit
 import hashlib
+import threading
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+# Change-log durability only needs the data (and size) on disk, not the
+# timestamps; fdatasync skips that metadata write where the OS has it
+_sync_data = getattr(os, 'fdatasync', os.fsync)
+
 class TrustLevel(Enum):
     """Trust levels for workers based on verification history."""
     UNTRUSTED = 0      # New worker, no history (requires 5 confirmations)
@@ -75,10 +86,20 @@ class ConsensusState:
     consensus_reached: bool = False
     consensus_result: Optional[bool] = None  # True = all converged, False = counterexample
     conflicting_results: List[VerificationResult] = None
+    # Indexes over confirmations, kept in step by add_confirmation()
+    worker_ids: set = field(default_factory=set)
+    user_counts: Dict[str, int] = field(default_factory=dict)  # None user counted as "unknown"
     
     def __post_init__(self):
         if self.conflicting_results is None:
             self.conflicting_results = []
+    
+    def add_confirmation(self, result: VerificationResult):
+        """Append a confirmation and update the worker/user indexes."""
+        self.confirmations.append(result)
+        self.worker_ids.add(result.worker_id)
+        user = result.user_id or "unknown"
+        self.user_counts[user] = self.user_counts.get(user, 0) + 1
 
 class TrustSystem:
     """Manages worker reputation and verification consensus."""
@@ -88,6 +109,9 @@ class TrustSystem:
     TRUSTED_THRESHOLD = 100      # Correct verifications to become TRUSTED
     ELITE_THRESHOLD = 1000       # Correct verifications to become ELITE
     
+    # Verifications at which the reputation volume bonus reaches its 20 point cap
+    VOLUME_BONUS_CAP_AT = 9999
+    
     # Reputation decay
     DECAY_PERIOD_DAYS = 30       # Days before reputation starts decaying
     DECAY_RATE = 0.95            # Multiplier per month of inactivity
@@ -108,15 +132,51 @@ class TrustSystem:
         TrustLevel.ELITE: 0.02      # 2% spot-check
     }
     
+    # Seconds an active-worker count is reused for progress quorum sizing
+    ACTIVE_WORKERS_TTL = 60
+    
+    # Background writer: queued saves arriving within this window share one write
+    WRITE_COALESCE_SECONDS = 0.05
+    
+    # Change log: per-worker updates are appended between full snapshots
+    LOG_COMPACT_ENTRIES = 1000   # Rewrite the snapshot after this many logged updates
+    LOG_FSYNC_INTERVAL = 1.0     # Seconds between fsyncs of the change log
+    
+    _SNAPSHOT = 'snapshot'       # Writer queue items
+    _LOG = 'log'
+    
     def __init__(self, storage_file: str = "trust_database.json"):
         """Initialize trust system."""
         self.storage_file = storage_file
+        self.log_file = os.path.splitext(storage_file)[0] + '.log'
         self.workers: Dict[str, WorkerStats] = {}
         self.pending_consensus: Dict[Tuple[int, int], ConsensusState] = {}
+        self._active_workers_cache = (0, 0.0)  # (count, time counted)
+        
+        # Workers changed since they were last written to the change log
+        self._dirty_workers: set = set()
+        self._dirty_lock = threading.Lock()
+        self._log_fp = None
+        self._log_entries = 0
+        self._last_fsync = 0.0
+        # Bumped by each snapshot; the log only applies to the snapshot it follows
+        self._generation = 0
+        
+        # Byzantine scan cache: entries for suspicious workers, and the workers
+        # to re-score (every change that is persisted also lands here)
+        self._suspicious: Dict[str, Dict] = {}
+        
         self.load_state()
+        self._suspicion_dirty: set = set(self.workers)
+        
+        # Persistence runs on a writer thread so submissions never wait on disk
+        self._write_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name='trust-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.flush)
     
     def load_state(self):
-        """Load worker stats from persistent storage."""
+        """Load worker stats from the snapshot, then replay the change log."""
         try:
             with open(self.storage_file, 'r') as f:
                 data = json.load(f)
@@ -124,29 +184,161 @@ class TrustSystem:
                     # Convert trust_level string back to enum
                     stats_dict['trust_level'] = TrustLevel[stats_dict['trust_level']]
                     self.workers[worker_id] = WorkerStats(**stats_dict)
+                self._generation = data.get('log_generation', 0)
         except FileNotFoundError:
             print("[TRUST] No existing trust database, starting fresh")
         except Exception as e:
             print(f"[TRUST] Error loading trust database: {e}")
-    
-    def save_state(self):
-        """Save worker stats to persistent storage."""
+        
+        # A stale or damaged log must not be appended to: new entries would land
+        # under the wrong header or after the bad line and be skipped on replay
+        rewrite = False
         try:
-            data = {
-                'workers': {
-                    worker_id: {
-                        **asdict(stats),
-                        'trust_level': stats.trust_level.name  # Convert enum to string
-                    }
-                    for worker_id, stats in self.workers.items()
-                },
-                'last_updated': time.time()
-            }
-            with open(self.storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.log_file, 'r') as f:
+                try:
+                    header = json.loads(f.readline() or '{}')
+                except ValueError:
+                    header = {}
+                if header.get('generation') != self._generation:
+                    rewrite = True  # Log predates the snapshot (already folded into it)
+                else:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            rewrite = True  # Torn last line from an interrupted write
+                            break
+                        stats_dict = entry['worker']
+                        stats_dict['trust_level'] = TrustLevel[stats_dict['trust_level']]
+                        self.workers[stats_dict['worker_id']] = WorkerStats(**stats_dict)
+                        self._log_entries += 1
+                        if not line.endswith('\n'):
+                            rewrite = True  # Next append would join this line
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"[TRUST] Error saving trust database: {e}")
+            print(f"[TRUST] Error replaying trust change log: {e}")
+            rewrite = True
+        
+        if rewrite:
+            # Fold what was recovered into a new snapshot, which starts a fresh log
+            try:
+                self._write_snapshot()
+            except Exception as e:
+                print(f"[TRUST] Error saving trust database: {e}")
     
+    def _worker_record(self, stats: WorkerStats) -> Dict:
+        """JSON-ready dict of a worker's stats."""
+        return {
+            **asdict(stats),
+            'trust_level': stats.trust_level.name  # Convert enum to string
+        }
+    
+    def save_state(self):
+        """Queue a full snapshot of worker stats (written by the background writer)."""
+        self._suspicion_dirty.update(self.workers)
+        self._write_q.put(self._SNAPSHOT)
+    
+    def _save_workers(self, *worker_ids: str):
+        """Queue changed workers for the change log (O(changes), not a full rewrite)."""
+        with self._dirty_lock:
+            self._dirty_workers.update(worker_ids)
+        self._suspicion_dirty.update(worker_ids)
+        self._write_q.put(self._LOG)
+    
+    def mark_dirty(self, worker_id: Optional[str] = None):
+        """Record a change made outside this class: just that worker if given, else everything."""
+        if worker_id is not None:
+            self._save_workers(worker_id)
+        else:
+            self.save_state()
+    
+    def flush(self):
+        """Block until every queued save is on disk (also runs at interpreter exit)."""
+        self._write_q.join()
+        if self._log_fp is not None:
+            _sync_data(self._log_fp.fileno())
+    
+    def _writer_loop(self):
+        """Drain the save queue, folding each burst of requests into one write."""
+        while True:
+            items = [self._write_q.get()]
+            deadline = time.monotonic() + self.WRITE_COALESCE_SECONDS
+            while True:
+                try:
+                    items.append(self._write_q.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            try:
+                if self._SNAPSHOT in items:
+                    self._write_snapshot()
+                else:
+                    self._write_log()
+            except Exception as e:
+                print(f"[TRUST] Error saving trust database: {e}")
+            finally:
+                for _ in items:
+                    self._write_q.task_done()
+    
+    def _write_snapshot(self):
+        """Write a full snapshot of worker stats and start a fresh change log."""
+        generation = self._generation + 1
+        with self._dirty_lock:
+            self._dirty_workers.clear()  # Everything is in the snapshot
+        data = {
+            'workers': {
+                worker_id: self._worker_record(stats)
+                for worker_id, stats in list(self.workers.items())
+            },
+            'last_updated': time.time(),
+            'log_generation': generation
+        }
+        # Replace atomically so a crash never leaves a half-written snapshot
+        tmp_file = self.storage_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())  # On disk before the log it replaces is removed
+        os.replace(tmp_file, self.storage_file)
+        
+        self._generation = generation
+        self._reset_log()
+    
+    def _reset_log(self):
+        """Truncate the change log after a snapshot."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+        self._log_entries = 0
+    
+    def _write_log(self):
+        """Append changed workers to the change log; compact into a snapshot periodically."""
+        with self._dirty_lock:
+            dirty, self._dirty_workers = self._dirty_workers, set()
+        if not dirty:
+            return
+        if self._log_entries + len(dirty) > self.LOG_COMPACT_ENTRIES:
+            self._write_snapshot()
+            return
+        
+        if self._log_fp is None:
+            self._log_fp = open(self.log_file, 'a')
+            if self._log_fp.tell() == 0:
+                self._log_fp.write(json.dumps({'generation': self._generation}) + '\n')
+        for worker_id in dirty:
+            stats = self.workers.get(worker_id)
+            if stats is not None:
+                self._log_fp.write(json.dumps({'op': 'upsert', 'worker': self._worker_record(stats)},
+                                              separators=(',', ':')) + '\n')
+                self._log_entries += 1
+        self._log_fp.flush()
+        
+        now = time.time()
+        if now - self._last_fsync >= self.LOG_FSYNC_INTERVAL:
+            _sync_data(self._log_fp.fileno())
+            self._last_fsync = now
     
     def register_worker(self, worker_id: str, user_id: Optional[str] = None) -> WorkerStats:
         """Register a new worker or return existing stats. Can link to user account."""
@@ -156,11 +348,11 @@ class TrustSystem:
                 print(f"[TRUST] New worker registered: {worker_id[:16]}... (UNTRUSTED) - User: {user_id}")
             else:
                 print(f"[TRUST] New worker registered: {worker_id[:16]}... (UNTRUSTED)")
-            self.save_state()
+            self._save_workers(worker_id)
         elif user_id and not self.workers[worker_id].user_id:
             # Link existing worker to user account
             self.workers[worker_id].user_id = user_id
-            self.save_state()
+            self._save_workers(worker_id)
         return self.workers[worker_id]
     
     def get_workers_by_user(self, user_id: str) -> List[WorkerStats]:
@@ -180,15 +372,29 @@ class TrustSystem:
                 'average_reputation': 0.0
             }
         
+        # One pass over the user's workers for every total
+        verifications = correct = incorrect = numbers = 0
+        compute_time = reputation = 0
+        best_level = user_workers[0].trust_level
+        for w in user_workers:
+            verifications += w.total_verifications
+            correct += w.correct_verifications
+            incorrect += w.incorrect_verifications
+            numbers += w.total_numbers_checked
+            compute_time += w.total_compute_time
+            reputation += w.reputation_score
+            if w.trust_level.value > best_level.value:
+                best_level = w.trust_level
+        
         return {
             'total_workers': len(user_workers),
-            'total_verifications': sum(w.total_verifications for w in user_workers),
-            'correct_verifications': sum(w.correct_verifications for w in user_workers),
-            'incorrect_verifications': sum(w.incorrect_verifications for w in user_workers),
-            'total_numbers_checked': sum(w.total_numbers_checked for w in user_workers),
-            'total_compute_time': sum(w.total_compute_time for w in user_workers),
-            'average_reputation': sum(w.reputation_score for w in user_workers) / len(user_workers),
-            'best_trust_level': max((w.trust_level for w in user_workers), key=lambda t: t.value)
+            'total_verifications': verifications,
+            'correct_verifications': correct,
+            'incorrect_verifications': incorrect,
+            'total_numbers_checked': numbers,
+            'total_compute_time': compute_time,
+            'average_reputation': reputation / len(user_workers),
+            'best_trust_level': best_level
         }
     
     def get_worker_stats(self, worker_id: str) -> Optional[WorkerStats]:
@@ -204,9 +410,12 @@ class TrustSystem:
         accuracy = stats.correct_verifications / stats.total_verifications
         base_score = accuracy * 100.0
         
-        # Bonus for volume (logarithmic scaling)
-        import math
-        volume_bonus = min(20.0, math.log10(stats.total_verifications + 1) * 5.0)
+        # Bonus for volume (logarithmic scaling); capped from 9,999 verifications
+        # on (log10(10000) * 5 == 20), so established workers skip the log
+        if stats.total_verifications >= self.VOLUME_BONUS_CAP_AT:
+            volume_bonus = 20.0
+        else:
+            volume_bonus = min(20.0, math.log10(stats.total_verifications + 1) * 5.0)
         
         # Penalty for recent errors (consecutive incorrect)
         error_penalty = min(30.0, stats.consecutive_incorrect * 10.0)
@@ -272,6 +481,9 @@ class TrustSystem:
         stats.total_verifications += 1
         stats.total_numbers_checked += result.numbers_checked
         stats.total_compute_time += result.compute_time
+        with self._dirty_lock:
+            self._dirty_workers.add(result.worker_id)  # Written with the next save
+        self._suspicion_dirty.add(result.worker_id)
         
         # Set user_id in worker stats if provided
         if result.user_id and not stats.user_id:
@@ -292,34 +504,28 @@ class TrustSystem:
         consensus = self.pending_consensus[range_key]
         
         # Check if this worker already submitted for this range
-        if any(c.worker_id == result.worker_id for c in consensus.confirmations):
+        if result.worker_id in consensus.worker_ids:
             return False, "Worker already submitted verification for this range"
         
         # 🚨 CRITICAL SECURITY CHECK: Prevent self-verification
         # Check if this is the ORIGINAL worker who did the computation
         if len(consensus.confirmations) == 0:
             # This is the first submission - the original worker
-            consensus.confirmations.append(result)
+            consensus.add_confirmation(result)
             remaining = consensus.required_confirmations - len(consensus.confirmations)
             return False, f"🔒 Original work submitted. Awaiting {remaining} independent verification(s) from OTHER workers"
         
         # 🚨 PREVENT SAME-WORKER VERIFICATION
-        if result.worker_id in [c.worker_id for c in consensus.confirmations]:
+        if result.worker_id in consensus.worker_ids:
             return False, "🚫 SECURITY VIOLATION: Worker cannot verify their own work"
         
         # 🚨 CHECK USER-LEVEL VERIFICATION RULES
         original_user = consensus.confirmations[0].user_id
         current_user = result.user_id
         
-        # Count verifications by user
-        user_verification_count = {}
-        for conf in consensus.confirmations:
-            user_id = conf.user_id or "unknown"
-            user_verification_count[user_id] = user_verification_count.get(user_id, 0) + 1
-        
-        current_user_count = user_verification_count.get(current_user or "unknown", 0)
-        other_user_count = sum(count for user, count in user_verification_count.items() 
-                              if user != original_user)
+        # Verifications by user, from the index kept on the consensus state
+        current_user_count = consensus.user_counts.get(current_user or "unknown", 0)
+        other_user_count = len(consensus.confirmations) - consensus.user_counts.get(original_user, 0)
         
         # Rule: At least ONE verification MUST be from a different user
         if current_user == original_user and other_user_count == 0 and len(consensus.confirmations) >= 2:
@@ -330,7 +536,7 @@ class TrustSystem:
             return False, f"🚫 SECURITY RULE: User {current_user or 'unknown'} can only provide ONE verification per range"
         
         # Add to confirmations (passed security checks)
-        consensus.confirmations.append(result)
+        consensus.add_confirmation(result)
         
         # Check for consensus
         if len(consensus.confirmations) >= consensus.required_confirmations:
@@ -351,7 +557,7 @@ class TrustSystem:
                     worker.reputation_score = self.calculate_reputation(worker)
                     self.update_trust_level(worker)
                 
-                self.save_state()
+                self._save_workers(*consensus.worker_ids)
                 
                 result_str = "CONVERGED" if consensus.consensus_result else "⚠️ COUNTEREXAMPLE FOUND"
                 return True, f"✅ Consensus reached: {result_str} (confirmed by {len(consensus.confirmations)} workers)"
@@ -406,16 +612,11 @@ class TrustSystem:
         if range_key in self.pending_consensus:
             del self.pending_consensus[range_key]
         
-        self.save_state()
+        self._save_workers(*correct_workers, *incorrect_workers)
     
     def get_leaderboard(self, top_n: int = 10) -> List[WorkerStats]:
-        """Get top workers by reputation."""
-        sorted_workers = sorted(
-            self.workers.values(),
-            key=lambda w: w.reputation_score,
-            reverse=True
-        )
-        return sorted_workers[:top_n]
+        """Get top workers by reputation (partial heap selection, not a full sort)."""
+        return heapq.nlargest(top_n, self.workers.values(), key=lambda w: w.reputation_score)
     
     def get_statistics(self) -> Dict:
         """Get overall network statistics."""
@@ -428,27 +629,36 @@ class TrustSystem:
             }
         
         active_cutoff = time.time() - 86400  # Active in last 24 hours
-        active_workers = sum(1 for w in self.workers.values() if w.last_active > active_cutoff)
+        
+        # One pass over the workers for every total and the trust level histogram
+        active_workers = verifications = numbers = 0
+        compute_time = 0
+        level_counts = dict.fromkeys(TrustLevel, 0)
+        for w in self.workers.values():
+            if w.last_active > active_cutoff:
+                active_workers += 1
+            verifications += w.total_verifications
+            numbers += w.total_numbers_checked
+            compute_time += w.total_compute_time
+            level_counts[w.trust_level] += 1
         
         return {
             'total_workers': len(self.workers),
             'active_workers': active_workers,
-            'total_verifications': sum(w.total_verifications for w in self.workers.values()),
-            'total_numbers_checked': sum(w.total_numbers_checked for w in self.workers.values()),
-            'total_compute_time': sum(w.total_compute_time for w in self.workers.values()),
+            'total_verifications': verifications,
+            'total_numbers_checked': numbers,
+            'total_compute_time': compute_time,
             'trust_levels': {
-                'ELITE': sum(1 for w in self.workers.values() if w.trust_level == TrustLevel.ELITE),
-                'TRUSTED': sum(1 for w in self.workers.values() if w.trust_level == TrustLevel.TRUSTED),
-                'VERIFIED': sum(1 for w in self.workers.values() if w.trust_level == TrustLevel.VERIFIED),
-                'UNTRUSTED': sum(1 for w in self.workers.values() if w.trust_level == TrustLevel.UNTRUSTED),
-                'BANNED': sum(1 for w in self.workers.values() if w.trust_level == TrustLevel.BANNED)
+                'ELITE': level_counts[TrustLevel.ELITE],
+                'TRUSTED': level_counts[TrustLevel.TRUSTED],
+                'VERIFIED': level_counts[TrustLevel.VERIFIED],
+                'UNTRUSTED': level_counts[TrustLevel.UNTRUSTED],
+                'BANNED': level_counts[TrustLevel.BANNED]
             }
         }
     
     def needs_spot_check(self, worker_id: str) -> bool:
         """Determine if a worker needs a spot-check verification."""
-        import random
-        
         stats = self.get_worker_stats(worker_id)
         if not stats or stats.trust_level == TrustLevel.UNTRUSTED:
             return True  # Always verify untrusted workers
@@ -489,6 +699,8 @@ class TrustSystem:
                 'claimed_progress': claimed_progress,
                 'required_confirmations': self._get_required_confirmations_for_progress(),
                 'confirmations': [],
+                'worker_ids': set(),  # Index of confirmations for the duplicate check
+                'user_ids': set(),
                 'consensus_reached': False,
                 'first_claim_time': time.time()
             }
@@ -496,10 +708,8 @@ class TrustSystem:
         consensus_state = self.pending_consensus[progress_key]
         
         # Check if this worker/user already contributed to this consensus
-        for existing_claim in consensus_state['confirmations']:
-            if (existing_claim['worker_id'] == worker_id or 
-                existing_claim['user_id'] == user_id):
-                return False, f"Worker/User already submitted claim for progress {claimed_progress:,}"
+        if worker_id in consensus_state['worker_ids'] or user_id in consensus_state['user_ids']:
+            return False, f"Worker/User already submitted claim for progress {claimed_progress:,}"
         
         # Add this claim to consensus
         consensus_state['confirmations'].append({
@@ -509,6 +719,8 @@ class TrustSystem:
             'timestamp': time.time(),
             'trust_level': stats.trust_level.name
         })
+        consensus_state['worker_ids'].add(worker_id)
+        consensus_state['user_ids'].add(user_id)
         
         confirmations = len(consensus_state['confirmations'])
         required = consensus_state['required_confirmations']
@@ -519,33 +731,37 @@ class TrustSystem:
         
         return False, f"Progress claim recorded ({confirmations}/{required} confirmations needed)"
 
+    def _count_active_workers(self) -> int:
+        """
+        Count active workers across all trust levels (excluding banned).
+        The count moves slowly, so a scan is reused for ACTIVE_WORKERS_TTL seconds.
+        """
+        now = time.time()
+        count, counted_at = self._active_workers_cache
+        if now - counted_at < self.ACTIVE_WORKERS_TTL:
+            return count
+        
+        active_cutoff = now - 86400  # Active in last 24h
+        count = sum(1 for stats in self.workers.values()
+                    if stats.trust_level != TrustLevel.BANNED and stats.last_active > active_cutoff)
+        self._active_workers_cache = (count, now)
+        return count
+    
     def _get_required_confirmations_for_progress(self) -> int:
         """
         🔒 BYZANTINE FAULT TOLERANCE: Calculate confirmations needed to resist malicious nodes.
-        Uses (3f + 1) formula where f is the maximum number of malicious nodes.
+        With n active workers tolerating f = (n - 1) // 3 malicious ones (n >= 3f + 1),
+        a quorum of ceil((n + f + 1) / 2) guarantees any two quorums share an honest worker.
         """
-        # Count active workers across all trust levels (excluding banned)
-        active_workers = sum(1 for stats in self.workers.values() 
-                           if stats.trust_level != TrustLevel.BANNED
-                           and (time.time() - stats.last_active) < 86400)  # Active in last 24h
+        active_workers = self._count_active_workers()
         
         if active_workers < 3:
             return active_workers  # Need all workers if less than 3
         
-        # Byzantine fault tolerance: can handle up to f malicious nodes with 3f + 1 total nodes
-        # We calculate required confirmations to ensure honest majority
-        max_malicious = active_workers // 3  # Maximum malicious nodes we can tolerate
-        
-        # Required confirmations for Byzantine consensus
-        # Need at least 2f + 1 confirmations where f is max malicious nodes
-        required_confirmations = 2 * max_malicious + 1
+        max_malicious = (active_workers - 1) // 3  # Maximum malicious nodes we can tolerate
         
-        # Minimum safety: always require at least 3 confirmations
-        required_confirmations = max(3, required_confirmations)
-        
-        # Maximum practical: don't require more than 2/3 of active workers
-        max_practical = (active_workers * 2) // 3
-        required_confirmations = min(required_confirmations, max_practical)
+        # ceil((n + f + 1) / 2), never fewer than 3 (always <= n for n >= 3)
+        required_confirmations = max(3, (active_workers + max_malicious + 2) // 2)
         
         print(f"[TRUST] 🛡️ Byzantine tolerance: {active_workers} active workers, "
               f"can handle {max_malicious} malicious, requiring {required_confirmations} confirmations")
@@ -576,6 +792,49 @@ class TrustSystem:
         consensus_state = self.pending_consensus.get(progress_key)
         return consensus_state['consensus_reached'] if consensus_state else False
 
+    def _score_worker(self, worker_id: str, stats: WorkerStats) -> Optional[Dict]:
+        """Suspicion entry for one worker, or None if it scores below 3."""
+        suspicion_score = 0
+        reasons = []
+        
+        # Check for unusual error patterns
+        if stats.total_verifications > 10:
+            error_rate = stats.incorrect_verifications / stats.total_verifications
+            if error_rate > 0.15:  # More than 15% error rate
+                suspicion_score += 3
+                reasons.append(f"High error rate: {error_rate:.1%}")
+        
+        # Check for timing anomalies (submissions too fast/slow)
+        if stats.total_compute_time > 0 and stats.total_numbers_checked > 0:
+            avg_speed = stats.total_numbers_checked / stats.total_compute_time
+            if avg_speed > 1000000:  # Unrealistically fast (>1M numbers/second)
+                suspicion_score += 4
+                reasons.append(f"Unrealistic computation speed: {avg_speed:.0f} nums/sec")
+            elif avg_speed < 100:  # Unrealistically slow (<100 numbers/second)
+                suspicion_score += 2
+                reasons.append(f"Unusually slow computation: {avg_speed:.0f} nums/sec")
+        
+        # Check for inconsistent trust level behavior
+        if stats.trust_level == TrustLevel.ELITE and stats.consecutive_incorrect > 0:
+            suspicion_score += 3
+            reasons.append("Elite worker with recent errors")
+        
+        # Check for rapid trust level changes (possible Sybil attack)
+        if (stats.trust_level in [TrustLevel.TRUSTED, TrustLevel.ELITE] and 
+            stats.total_verifications < 50):
+            suspicion_score += 2
+            reasons.append("High trust level with low verification count")
+        
+        if suspicion_score >= 3:
+            return {
+                'worker_id': worker_id,
+                'user_id': stats.user_id,
+                'suspicion_score': suspicion_score,
+                'reasons': reasons,
+                'trust_level': stats.trust_level.name
+            }
+        return None
+    
     def detect_byzantine_attacks(self) -> Dict[str, any]:
         """
         🔒 BYZANTINE DETECTION: Analyze consensus patterns to detect potential attacks.
@@ -590,47 +849,17 @@ class TrustSystem:
             'risk_level': 'LOW'  # LOW, MEDIUM, HIGH, CRITICAL
         }
         
-        # Analyze worker behavior patterns
-        for worker_id, stats in self.workers.items():
-            suspicion_score = 0
-            reasons = []
-            
-            # Check for unusual error patterns
-            if stats.total_verifications > 10:
-                error_rate = stats.incorrect_verifications / stats.total_verifications
-                if error_rate > 0.15:  # More than 15% error rate
-                    suspicion_score += 3
-                    reasons.append(f"High error rate: {error_rate:.1%}")
-            
-            # Check for timing anomalies (submissions too fast/slow)
-            if stats.total_compute_time > 0 and stats.total_numbers_checked > 0:
-                avg_speed = stats.total_numbers_checked / stats.total_compute_time
-                if avg_speed > 1000000:  # Unrealistically fast (>1M numbers/second)
-                    suspicion_score += 4
-                    reasons.append(f"Unrealistic computation speed: {avg_speed:.0f} nums/sec")
-                elif avg_speed < 100:  # Unrealistically slow (<100 numbers/second)
-                    suspicion_score += 2
-                    reasons.append(f"Unusually slow computation: {avg_speed:.0f} nums/sec")
-            
-            # Check for inconsistent trust level behavior
-            if stats.trust_level == TrustLevel.ELITE and stats.consecutive_incorrect > 0:
-                suspicion_score += 3
-                reasons.append("Elite worker with recent errors")
-            
-            # Check for rapid trust level changes (possible Sybil attack)
-            if (stats.trust_level in [TrustLevel.TRUSTED, TrustLevel.ELITE] and 
-                stats.total_verifications < 50):
-                suspicion_score += 2
-                reasons.append("High trust level with low verification count")
-            
-            if suspicion_score >= 3:
-                attack_indicators['suspicious_workers'].append({
-                    'worker_id': worker_id,
-                    'user_id': stats.user_id,
-                    'suspicion_score': suspicion_score,
-                    'reasons': reasons,
-                    'trust_level': stats.trust_level.name
-                })
+        # Analyze worker behavior patterns; scores are cached and only workers
+        # whose stats changed since the last scan are re-scored
+        dirty, self._suspicion_dirty = self._suspicion_dirty, set()
+        for worker_id in dirty:
+            stats = self.workers.get(worker_id)
+            entry = self._score_worker(worker_id, stats) if stats is not None else None
+            if entry is not None:
+                self._suspicious[worker_id] = entry
+            else:
+                self._suspicious.pop(worker_id, None)
+        attack_indicators['suspicious_workers'] = [dict(entry) for entry in self._suspicious.values()]
         
         # Analyze consensus attempts for coordinated attacks
         consensus_attempts = list(self.pending_consensus.values())